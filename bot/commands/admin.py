@@ -2,13 +2,211 @@
 Administrator commands for movie club management
 """
 
+import asyncio
 import discord
 from discord.ext import commands
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import logging
+import re
+import time
+from typing import Final
+from sqlalchemy import and_, case, delete, func, select, update
+from sqlalchemy.orm import joinedload
+from models.database import User, MoviePick, RotationSkip
+from utils.date_utils import parse_date
+from utils.parsers import parse_movie_input, parse_user_list
 
 logger = logging.getLogger(__name__)
 
+# Date every rotation set up with !setup_rotation starts from
+_ROTATION_EPOCH = datetime(2025, 5, 5)
+_ROTATION_EPOCH_STR = "May 5, 2025"
+
+# A user mention, <@id> or the legacy nickname form <@!id>
+_MENTION_RE = re.compile(r"<@!?(\d+)>")
+
+# Reply when a mentioned user can't be fetched from Discord
+_MENTION_NOT_FOUND = (
+    "❌ Could not find user with that mention. Try using their username directly."
+)
+
+# How many fetched usernames AdminCommands keeps for mention lookups
+_FETCHED_USERNAMES_MAX = 256
+
+# Month abbreviations for embed dates, as %b gives them in the C locale
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# Embed colors
+_COLOR_OK: Final = discord.Colour(0x00FF00)
+_COLOR_WARN: Final = discord.Colour(0xFF6600)
+_COLOR_ERR: Final = discord.Colour(0xFF0000)
+_COLOR_INFO: Final = discord.Colour(0x0099FF)
+_COLOR_MUTED: Final = discord.Colour(0x808080)
+
+# Hint shown after commands that change the rotation schedule
+_VIEW_SCHEDULE_HINT: Final = "Use `!schedule` to see the updated rotation"
+
+# Discord rejects embeds with more fields than this
+_EMBED_MAX_FIELDS: Final = 25
+
+# Skip reasons are stored, and shown in embed fields, up to the column length
+_SKIP_REASON_MAX: Final = RotationSkip.__table__.c.skip_reason.type.length
+
+# Commands that make several database calls before their first reply; the
+# typing indicator is started as soon as they are invoked
+_TYPING_COMMANDS = frozenset(
+    {
+        "skip_current_pick",
+        "skip_next_pick",
+        "force_pick",
+        "admin_stats",
+        "add_historical_pick",
+    }
+)
+
+
+def _fmt_md(d):
+    """Format a date as e.g. 'May 05', like strftime("%b %d")"""
+    return f"{_MONTHS[d.month - 1]} {d.day:02d}"
+
+
+def _fmt_mdy(d):
+    """Format a date as e.g. 'May 05, 2025', like strftime("%b %d, %Y")"""
+    return f"{_MONTHS[d.month - 1]} {d.day:02d}, {d.year}"
+
+
+def _format_period(start, end):
+    """Format a rotation period as e.g. 'May 05 - May 18'"""
+    return f"{_fmt_md(start)} - {_fmt_md(end)}"
+
+
+def _embed(title, description=None, color=_COLOR_INFO, fields=()):
+    """Build an embed from (name, value, inline) field tuples"""
+    embed = discord.Embed(title=title, description=description, color=color)
+    for name, value, inline in fields:
+        embed.add_field(name=name, value=value, inline=inline)
+    return embed
+
+
+class _FieldPages(discord.ui.View):
+    """Prev/Next buttons paging through more fields than one embed can hold
+
+    Only the page being shown is built into an embed, and only the command's
+    author can turn pages.
+    """
+
+    def __init__(self, author_id, title, description, color, fields):
+        super().__init__(timeout=120.0)
+        self.author_id = author_id
+        self.title = title
+        self.description = description
+        self.color = color
+        self.pages = [
+            fields[start : start + _EMBED_MAX_FIELDS]
+            for start in range(0, len(fields), _EMBED_MAX_FIELDS)
+        ]
+        self.index = 0
+        self.message = None
+        self._update_buttons()
+
+    def page_embed(self):
+        """Build the embed for the current page"""
+        embed = _embed(self.title, self.description, self.color, self.pages[self.index])
+        embed.set_footer(text=f"Page {self.index + 1}/{len(self.pages)}")
+        return embed
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index == len(self.pages) - 1
+
+    async def _show_page(self, interaction):
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.page_embed(), view=self)
+
+    async def interaction_check(self, interaction):
+        return interaction.user.id == self.author_id
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction, button):
+        self.index -= 1
+        await self._show_page(interaction)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction, button):
+        self.index += 1
+        await self._show_page(interaction)
+
+    async def on_timeout(self):
+        if self.message is None:
+            return
+        for item in self.children:
+            item.disabled = True
+        try:
+            await self.message.edit(view=self)
+        except discord.HTTPException:
+            pass
+
+
+async def _send_fields(ctx, title, description, color, fields):
+    """Send (name, value, inline) fields, paginated if one embed can't hold them"""
+    if len(fields) <= _EMBED_MAX_FIELDS:
+        await ctx.send(embed=_embed(title, description, color, fields))
+        return
+
+    view = _FieldPages(ctx.author.id, title, description, color, fields)
+    view.message = await ctx.send(embed=view.page_embed(), view=view)
+
+
+def _clip_reason(reason):
+    """Shorten a skip reason to fit the skip_reason column"""
+    if reason and len(reason) > _SKIP_REASON_MAX:
+        return reason[: _SKIP_REASON_MAX - 1] + "…"
+    return reason
+
+
+def _mentioned_user_id(tag):
+    """Return the user id from a <@id> mention, or None for a plain name"""
+    # Plain usernames are the common case; skip the regex for them
+    if not tag.startswith("<"):
+        return None
+    mention = _MENTION_RE.fullmatch(tag)
+    return int(mention.group(1)) if mention else None
+
+
+def _confirmation_check(ctx, phrase):
+    """Build a wait_for check matching `phrase` typed by the command's author
+
+    The check runs for every message in the bot's channels while waiting, so
+    the cheap length compare rejects most traffic before anything else.
+    """
+    author_id = ctx.author.id
+    channel = ctx.channel
+    phrase_len = len(phrase)
+
+    def check(m):
+        content = m.content
+        return (
+            len(content) == phrase_len
+            and content == phrase
+            and m.author.id == author_id
+            and m.channel == channel
+        )
+
+    return check
+
 
 class AdminCommands(commands.Cog):
     """Administrative commands for movie club management"""
@@ -17,7 +215,82 @@ class AdminCommands(commands.Cog):
         self.bot = bot
         self.rotation_service = bot.services["rotation"]
         self.movie_service = bot.services["movie"]
-        self.rating_service = bot.services["rating"]
+        # Usernames of mentioned users that weren't in the bot's user cache
+        self._fetched_usernames = {}
+        # (skips_version, total_skips, fields) from the last !list_skips
+        self._skips_cache = None
+
+    async def cog_before_invoke(self, ctx):
+        """Acknowledge slow commands right away and start timing"""
+        ctx.command_started_at = time.perf_counter()
+        if ctx.command.name in _TYPING_COMMANDS:
+            await ctx.typing()
+
+    async def cog_after_invoke(self, ctx):
+        """Log how long the command took"""
+        elapsed_ms = (time.perf_counter() - ctx.command_started_at) * 1000
+        logger.info(f"⏱️ cmd={ctx.command.name} total={elapsed_ms:.0f}ms")
+
+    async def _await_confirmation(self, ctx, prompt, phrase, cancelled):
+        """Send a confirmation prompt and wait for the author to type `phrase`
+
+        `prompt` is an embed or plain message text. On timeout the prompt is
+        replaced with `cancelled` and False is returned.
+        """
+        if isinstance(prompt, discord.Embed):
+            confirmation_msg = await ctx.send(embed=prompt)
+        else:
+            confirmation_msg = await ctx.send(prompt)
+
+        # wait_for registers a one-shot listener that discord.py drops as
+        # soon as the check passes or the future is cancelled. Without its
+        # own timeout it awaits that future directly instead of wrapping it
+        # in asyncio.wait_for
+        try:
+            async with asyncio.timeout(30.0):
+                await self.bot.wait_for(
+                    "message", check=_confirmation_check(ctx, phrase)
+                )
+        except TimeoutError:
+            await confirmation_msg.edit(content=cancelled, embed=None)
+            return False
+        return True
+
+    async def _username_arg(self, ctx, tag, not_found=_MENTION_NOT_FOUND):
+        """Resolve a username argument, replying with `not_found` on failure
+
+        Returns None if the reply was sent and the command should stop.
+        """
+        try:
+            return await self._resolve_username(tag)
+        except discord.HTTPException:
+            await ctx.send(not_found)
+            return None
+
+    async def _resolve_username(self, tag):
+        """Turn a `@name` or `<@id>` command argument into a Discord username
+
+        Mentioned users come from the bot's user cache when possible; names
+        that had to be fetched over the API are remembered so later commands
+        don't fetch them again. Raises discord.HTTPException if the mentioned
+        user can't be fetched.
+        """
+        tag = tag.strip()
+        user_id = _mentioned_user_id(tag)
+        if user_id is None:
+            return tag.lstrip("@")
+
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user.name
+
+        username = self._fetched_usernames.get(user_id)
+        if username is None:
+            user = await self.bot.fetch_user(user_id)
+            if len(self._fetched_usernames) >= _FETCHED_USERNAMES_MAX:
+                del self._fetched_usernames[next(iter(self._fetched_usernames))]
+            username = self._fetched_usernames[user_id] = user.name
+        return username
 
     @commands.command(name="setup_rotation")
     @commands.has_permissions(administrator=True)
@@ -28,35 +301,23 @@ class AdminCommands(commands.Cog):
         """
         try:
             # Parse the user list
-            user_data = []
-
-            for pair in user_list.split(","):
-                if ":" in pair:
-                    username, real_name = pair.strip().split(":", 1)
-                    user_data.append((username.strip(), real_name.strip()))
-                else:
-                    username = pair.strip()
-                    user_data.append((username, username))
+            user_data = parse_user_list(user_list)
 
             # Setup rotation with May 5th, 2025 as start date
-            await self.rotation_service.setup_rotation(user_data)
-
-            # Set the specific start date to May 5th, 2025
-            may_5_2025 = datetime(2025, 5, 5)
-            await self.rotation_service.update_rotation_start_date(may_5_2025)
-
-            embed = discord.Embed(
-                title="✅ Rotation Setup Complete",
-                description=f"Set up rotation for {len(user_data)} members\nRotation started: May 5, 2025",
-                color=0x00FF00,
+            await self.rotation_service.setup_rotation(
+                user_data, start_date=_ROTATION_EPOCH
             )
 
-            for i, (username, real_name) in enumerate(user_data, 1):
-                embed.add_field(
-                    name=f"#{i} {real_name}", value=f"@{username}", inline=True
-                )
-
-            await ctx.send(embed=embed)
+            await _send_fields(
+                ctx,
+                "✅ Rotation Setup Complete",
+                f"Set up rotation for {len(user_data)} members\nRotation started: {_ROTATION_EPOCH_STR}",
+                _COLOR_OK,
+                [
+                    (f"#{i} {real_name}", f"@{username}", True)
+                    for i, (username, real_name) in enumerate(user_data, 1)
+                ],
+            )
 
         except Exception as e:
             logger.error(f"Error setting up rotation: {e}")
@@ -74,66 +335,29 @@ class AdminCommands(commands.Cog):
 
         Example: !skip_current_pick Paul is sick
         """
+        reason = _clip_reason(reason)
         try:
-            # Get current situation before skip
-            current_user, current_start, current_end = (
-                await self.rotation_service.get_current_picker()
-            )
-
-            # Get who will become the new current picker
-            next_user, next_start, next_end = (
-                await self.rotation_service.get_next_picker()
-            )
-
-            # Confirm the skip action
-            confirm_embed = discord.Embed(
-                title="⚠️ Confirm Skip Current Picker",
-                description=(
-                    f"This will skip **{current_user.real_name}**'s CURRENT period "
-                    f"({current_start.strftime('%b %d')} - {current_end.strftime('%b %d')})\n\n"
-                    f"**{next_user.real_name}** will become the current picker immediately."
-                ),
-                color=0xFF6600,
-            )
-
-            # Check if they've already picked
-            user_pick = await self.rotation_service.get_user_active_pick(
-                current_user.discord_username
-            )
-            if user_pick:
-                movie_title = user_pick.movie_title
-                if user_pick.movie_year:
-                    movie_title += f" ({user_pick.movie_year})"
-                confirm_embed.add_field(
-                    name="⚠️ Warning",
-                    value=f"{current_user.real_name} has already picked: **{movie_title}**\nThis movie selection will be deleted!",
-                    inline=False,
+            # Get current situation before skip, and who will become the
+            # new current picker
+            (current_user, current_start, current_end), (next_user, _, _) = (
+                await asyncio.gather(
+                    self.rotation_service.get_current_picker(),
+                    self.rotation_service.get_next_picker(),
                 )
-
-            confirm_embed.add_field(
-                name="Type to confirm",
-                value="Type `CONFIRM SKIP` within 30 seconds to proceed",
-                inline=False,
             )
 
-            if reason:
-                confirm_embed.add_field(name="Reason", value=reason, inline=False)
-
-            confirmation_msg = await ctx.send(embed=confirm_embed)
-
-            def check(m):
-                return (
-                    m.author == ctx.author
-                    and m.channel == ctx.channel
-                    and m.content == "CONFIRM SKIP"
-                )
-
-            try:
-                await self.bot.wait_for("message", check=check, timeout=30.0)
-            except:
-                await confirmation_msg.edit(
-                    content="❌ Skip cancelled (timed out)", embed=None
-                )
+            # Confirm the skip action
+            if not await self._confirm_skip(
+                ctx,
+                "⚠️ Confirm Skip Current Picker",
+                f"This will skip **{current_user.real_name}**'s CURRENT period "
+                f"({_format_period(current_start, current_end)})\n\n"
+                f"**{next_user.real_name}** will become the current picker immediately.",
+                current_user,
+                current_start,
+                current_end,
+                reason,
+            ):
                 return
 
             # Perform the skip
@@ -146,7 +370,7 @@ class AdminCommands(commands.Cog):
                 result_embed = discord.Embed(
                     title="✅ Current Picker Skipped",
                     description=message,
-                    color=0x00FF00,
+                    color=_COLOR_OK,
                 )
 
                 result_embed.add_field(
@@ -169,7 +393,7 @@ class AdminCommands(commands.Cog):
                 # Show updated schedule
                 result_embed.add_field(
                     name="View Updated Schedule",
-                    value="Use `!schedule` to see the updated rotation",
+                    value=_VIEW_SCHEDULE_HINT,
                     inline=False,
                 )
 
@@ -182,7 +406,7 @@ class AdminCommands(commands.Cog):
 
             else:
                 error_embed = discord.Embed(
-                    title="❌ Skip Failed", description=message, color=0xFF0000
+                    title="❌ Skip Failed", description=message, color=_COLOR_ERR
                 )
                 await ctx.send(embed=error_embed)
 
@@ -202,66 +426,25 @@ class AdminCommands(commands.Cog):
 
         Example: !skip_next_pick Derek is out of town
         """
+        reason = _clip_reason(reason)
         try:
-            # Get current situation
-            current_user, current_start, current_end = (
-                await self.rotation_service.get_current_picker()
-            )
-
             # Get who would normally be next (before skip)
             next_user, next_start, next_end = (
                 await self.rotation_service.get_next_picker()
             )
 
             # Confirm the skip action
-            confirm_embed = discord.Embed(
-                title="⚠️ Confirm Skip Next Picker",
-                description=(
-                    f"This will skip **{next_user.real_name}**'s upcoming period "
-                    f"({next_start.strftime('%b %d')} - {next_end.strftime('%b %d')})\n\n"
-                    f"The person after them will become the next picker."
-                ),
-                color=0xFF6600,
-            )
-
-            # Check if they've already picked
-            user_pick = await self.rotation_service.get_user_active_pick(
-                next_user.discord_username
-            )
-            if user_pick:
-                movie_title = user_pick.movie_title
-                if user_pick.movie_year:
-                    movie_title += f" ({user_pick.movie_year})"
-                confirm_embed.add_field(
-                    name="⚠️ Warning",
-                    value=f"{next_user.real_name} has already picked: **{movie_title}**\nThis movie selection will be deleted!",
-                    inline=False,
-                )
-
-            confirm_embed.add_field(
-                name="Type to confirm",
-                value="Type `CONFIRM SKIP` within 30 seconds to proceed",
-                inline=False,
-            )
-
-            if reason:
-                confirm_embed.add_field(name="Reason", value=reason, inline=False)
-
-            confirmation_msg = await ctx.send(embed=confirm_embed)
-
-            def check(m):
-                return (
-                    m.author == ctx.author
-                    and m.channel == ctx.channel
-                    and m.content == "CONFIRM SKIP"
-                )
-
-            try:
-                await self.bot.wait_for("message", check=check, timeout=30.0)
-            except:
-                await confirmation_msg.edit(
-                    content="❌ Skip cancelled (timed out)", embed=None
-                )
+            if not await self._confirm_skip(
+                ctx,
+                "⚠️ Confirm Skip Next Picker",
+                f"This will skip **{next_user.real_name}**'s upcoming period "
+                f"({_format_period(next_start, next_end)})\n\n"
+                f"The person after them will become the next picker.",
+                next_user,
+                next_start,
+                next_end,
+                reason,
+            ):
                 return
 
             # Perform the skip
@@ -272,7 +455,7 @@ class AdminCommands(commands.Cog):
             if success:
                 # Create success embed
                 result_embed = discord.Embed(
-                    title="✅ Next Picker Skipped", description=message, color=0x00FF00
+                    title="✅ Next Picker Skipped", description=message, color=_COLOR_OK
                 )
 
                 result_embed.add_field(
@@ -293,7 +476,7 @@ class AdminCommands(commands.Cog):
                 # Show updated schedule
                 result_embed.add_field(
                     name="View Updated Schedule",
-                    value="Use `!schedule` to see the updated rotation",
+                    value=_VIEW_SCHEDULE_HINT,
                     inline=False,
                 )
 
@@ -306,7 +489,7 @@ class AdminCommands(commands.Cog):
 
             else:
                 error_embed = discord.Embed(
-                    title="❌ Skip Failed", description=message, color=0xFF0000
+                    title="❌ Skip Failed", description=message, color=_COLOR_ERR
                 )
                 await ctx.send(embed=error_embed)
 
@@ -314,54 +497,111 @@ class AdminCommands(commands.Cog):
             logger.error(f"Error in skip_next_pick command: {e}")
             await ctx.send(f"❌ Error processing skip: {str(e)}")
 
+    async def _confirm_skip(self, ctx, title, description, user, start, end, reason):
+        """Ask the author to type CONFIRM SKIP before skipping `user`
+
+        Warns that the user's movie pick will be deleted if they already
+        have one for the start-end period. Returns True once the skip is
+        confirmed.
+        """
+        confirm_embed = discord.Embed(
+            title=title, description=description, color=_COLOR_WARN
+        )
+
+        # Check if they've already picked; the caller has the period, so
+        # the pickers don't need to be worked out again
+        user_pick = await self.rotation_service.get_user_period_pick(
+            user.id, start, end
+        )
+        if user_pick:
+            movie_title = user_pick.movie_title
+            if user_pick.movie_year:
+                movie_title += f" ({user_pick.movie_year})"
+            confirm_embed.add_field(
+                name="⚠️ Warning",
+                value=f"{user.real_name} has already picked: **{movie_title}**\nThis movie selection will be deleted!",
+                inline=False,
+            )
+
+        confirm_embed.add_field(
+            name="Type to confirm",
+            value="Type `CONFIRM SKIP` within 30 seconds to proceed",
+            inline=False,
+        )
+
+        if reason:
+            confirm_embed.add_field(name="Reason", value=reason, inline=False)
+
+        return await self._await_confirmation(
+            ctx, confirm_embed, "CONFIRM SKIP", "❌ Skip cancelled (timed out)"
+        )
+
     @commands.command(name="list_skips")
     @commands.has_permissions(administrator=True)
     async def list_skips(self, ctx):
         """
         List all skipped periods (Admin only)
         """
-        session = self.rotation_service.db.get_session()
         try:
-            from models.database import RotationSkip
-
-            skips = (
-                session.query(RotationSkip)
-                .order_by(RotationSkip.original_start_date.desc())
-                .all()
-            )
+            # Reuse the last listing until a skip is added or removed
+            version = self.rotation_service.skips_version
+            if self._skips_cache and self._skips_cache[0] == version:
+                _, total_skips, fields = self._skips_cache
+            else:
+                total_skips, fields = await asyncio.get_running_loop().run_in_executor(
+                    None, self._load_recent_skips
+                )
+                self._skips_cache = (version, total_skips, fields)
 
-            if not skips:
+            if not total_skips:
                 await ctx.send("No skipped periods in the rotation history.")
                 return
 
-            embed = discord.Embed(
-                title="⏭️ Skipped Periods",
-                description=f"Total skips: {len(skips)}",
-                color=0xFF6600,
+            embed = _embed(
+                "⏭️ Skipped Periods",
+                f"Total skips: {total_skips}",
+                _COLOR_WARN,
+                fields,
             )
-
-            for skip in skips[:10]:  # Show last 10 skips
-                skip_info = (
-                    f"Period: {skip.original_start_date.strftime('%b %d')} - "
-                    f"{skip.original_end_date.strftime('%b %d, %Y')}\n"
-                    f"Skipped by: {skip.skipped_by}\n"
-                    f"When: {skip.skipped_at.strftime('%b %d, %Y')}"
-                )
-
-                if skip.skip_reason:
-                    skip_info += f"\nReason: {skip.skip_reason}"
-
-                embed.add_field(
-                    name=f"{skip.skipped_user.real_name}", value=skip_info, inline=False
-                )
-
             await ctx.send(embed=embed)
 
         except Exception as e:
             logger.error(f"Error listing skips: {e}")
             await ctx.send(f"❌ Error listing skips: {str(e)}")
-        finally:
-            session.close()
+
+    def _load_recent_skips(self):
+        """Count all skips and build embed fields for the last 10
+
+        Runs in an executor so the queries don't block the event loop.
+        """
+        with self.rotation_service.db.session_scope() as session:
+            total_skips = session.query(func.count(RotationSkip.id)).scalar()
+            if not total_skips:
+                return 0, []
+
+            # Load the skipped users in the same query
+            skips = (
+                session.query(RotationSkip)
+                .options(joinedload(RotationSkip.skipped_user))
+                .order_by(RotationSkip.original_start_date.desc())
+                .limit(10)
+                .all()
+            )
+
+            fields = []
+            for skip in skips:
+                lines = [
+                    f"Period: {_fmt_md(skip.original_start_date)} - "
+                    f"{_fmt_mdy(skip.original_end_date)}",
+                    f"Skipped by: {skip.skipped_by}",
+                    f"When: {_fmt_mdy(skip.skipped_at)}",
+                ]
+                if skip.skip_reason:
+                    lines.append(f"Reason: {skip.skip_reason}")
+
+                fields.append((skip.skipped_user.real_name, "\n".join(lines), False))
+
+            return total_skips, fields
 
     @commands.command(name="undo_skip")
     @commands.has_permissions(administrator=True)
@@ -370,62 +610,89 @@ class AdminCommands(commands.Cog):
         Undo a skip for a specific user's next skipped period (Admin only)
         Usage: !undo_skip derek
         """
-        session = self.rotation_service.db.get_session()
         try:
-            from models.database import User, RotationSkip
+            real_name, period_str = await asyncio.get_running_loop().run_in_executor(
+                None, self._delete_upcoming_skip, username
+            )
+        except Exception as e:
+            logger.error(f"Error undoing skip: {e}")
+            await ctx.send(f"❌ Error undoing skip: {str(e)}")
+            return
 
-            # Find the user
-            user = session.query(User).filter(User.discord_username == username).first()
-            if not user:
-                await ctx.send(f"❌ User @{username} not found")
-                return
+        if real_name is None:
+            await ctx.send(f"❌ User @{username} not found")
+            return
 
-            # Find the most recent future skip for this user
-            now = datetime.now()
-            skip = (
-                session.query(RotationSkip)
-                .filter(
-                    RotationSkip.skipped_user_id == user.id,
-                    RotationSkip.original_end_date >= now.date(),
-                )
-                .order_by(RotationSkip.original_start_date)
-                .first()
-            )
+        if period_str is None:
+            await ctx.send(f"❌ No upcoming skipped periods found for {real_name}")
+            return
 
-            if not skip:
-                await ctx.send(
-                    f"❌ No upcoming skipped periods found for {user.real_name}"
-                )
-                return
+        # Bumped here on the event loop, like every other version bump
+        self.rotation_service.skips_version += 1
+
+        embed = _embed(
+            "✅ Skip Removed",
+            f"Restored {real_name}'s period: {period_str}",
+            _COLOR_OK,
+            (
+                (
+                    "Note",
+                    "The schedule has been updated. Use `!schedule` to view changes.",
+                    False,
+                ),
+            ),
+        )
 
-            # Remove the skip
-            period_str = f"{skip.original_start_date.strftime('%b %d')} - {skip.original_end_date.strftime('%b %d')}"
-            session.delete(skip)
-            session.commit()
+        await ctx.send(embed=embed)
+        logger.info(
+            f"{ctx.author.name} removed skip for {real_name}'s period {period_str}"
+        )
 
-            embed = discord.Embed(
-                title="✅ Skip Removed",
-                description=f"Restored {user.real_name}'s period: {period_str}",
-                color=0x00FF00,
-            )
+    def _delete_upcoming_skip(self, username):
+        """Delete the user's earliest skip that hasn't ended yet
 
-            embed.add_field(
-                name="Note",
-                value="The schedule has been updated. Use `!schedule` to view changes.",
-                inline=False,
-            )
+        Returns (real_name, period_str); real_name is None if the user doesn't
+        exist and period_str is None if no skip was deleted. Runs in an
+        executor so the queries don't block the event loop; the caller bumps
+        skips_version once a skip is gone.
+        """
+        with self.rotation_service.db.session_scope() as session:
+            # The user and their earliest upcoming skip in one query; the
+            # outer join still returns the user when they have no skip
+            row = session.execute(
+                select(User, RotationSkip)
+                .outerjoin(
+                    RotationSkip,
+                    and_(
+                        RotationSkip.skipped_user_id == User.id,
+                        RotationSkip.original_end_date >= date.today(),
+                    ),
+                )
+                .where(func.lower(User.discord_username) == username.lower())
+                .order_by(RotationSkip.original_start_date)
+                .limit(1)
+            ).first()
+            if row is None:
+                return None, None
 
-            await ctx.send(embed=embed)
-            logger.info(
-                f"{ctx.author.name} removed skip for {user.real_name}'s period {period_str}"
+            user, skip = row
+            if not skip:
+                return user.real_name, None
+
+            real_name = user.real_name
+            period_str = _format_period(
+                skip.original_start_date, skip.original_end_date
             )
 
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Error undoing skip: {e}")
-            await ctx.send(f"❌ Error undoing skip: {str(e)}")
-        finally:
-            session.close()
+            # Delete by id and check the row count: if another undo removed
+            # this skip first, report it as already gone instead of failing
+            deleted = session.execute(
+                delete(RotationSkip).where(RotationSkip.id == skip.id)
+            ).rowcount
+            if not deleted:
+                return real_name, None
+            session.commit()
+            return real_name, period_str
 
     @commands.command(name="add_historical_pick")
     @commands.has_permissions(administrator=True)
@@ -443,58 +710,46 @@ class AdminCommands(commands.Cog):
         Usage: !add_historical_pick paul "Event Horizon" 1997 "May 10, 2025"
                !add_historical_pick derek "Sunshine" 2007 "May 25, 2025"
         """
-        try:
-            # Parse the pick date if provided
-            if pick_date_str:
-                from utils.date_utils import parse_date
-
-                pick_date = parse_date(pick_date_str)
-                if not pick_date:
-                    await ctx.send(
-                        "❌ Invalid date format. Try: 'May 10, 2025' or '2025-05-10'"
-                    )
-                    return
-            else:
-                pick_date = datetime.now()
-
-            # Get the user
-            user = await self.rotation_service.get_user_by_username(username)
-            if not user:
-                await ctx.send(f"❌ User @{username} not found in rotation")
+        # Parse the pick date if provided
+        if pick_date_str:
+            pick_date = parse_date(pick_date_str)
+            if not pick_date:
+                await ctx.send(
+                    "❌ Invalid date format. Try: 'May 10, 2025' or '2025-05-10'"
+                )
                 return
+        else:
+            pick_date = datetime.now()
 
-            # Calculate which period this pick should belong to based on the date
-
+        try:
             # Add historical pick with calculated period
-            movie_pick = await self.rotation_service.add_historical_pick(
+            movie_pick, user = await self.rotation_service.add_historical_pick(
                 username, movie_title, movie_year, pick_date
             )
-
-            embed = discord.Embed(
-                title="✅ Historical Pick Added",
-                description=f"Added **{movie_title}**{f' ({movie_year})' if movie_year else ''} to history",
-                color=0x00FF00,
-            )
-
-            embed.add_field(
-                name="Picker",
-                value=f"{user.real_name} (@{user.discord_username})",
-                inline=True,
-            )
-            embed.add_field(
-                name="Pick Date", value=pick_date.strftime("%b %d, %Y"), inline=True
-            )
-            embed.add_field(
-                name="Movie Added",
-                value=f"Use `!rate [1.0-10.0] {movie_pick.movie_title}` to rate this movie",
-                inline=False,
-            )
-
-            await ctx.send(embed=embed)
-
+        except ValueError as e:
+            await ctx.send(f"❌ {e}")
+            return
         except Exception as e:
-            logger.error(f"Error adding historical pick: {e}")
+            logger.exception("Error adding historical pick")
             await ctx.send(f"❌ Error adding historical pick: {str(e)}")
+            return
+
+        embed = _embed(
+            "✅ Historical Pick Added",
+            f"Added **{movie_title}**{f' ({movie_year})' if movie_year else ''} to history",
+            _COLOR_OK,
+            (
+                ("Picker", f"{user.real_name} (@{user.discord_username})", True),
+                ("Pick Date", _fmt_mdy(pick_date), True),
+                (
+                    "Movie Added",
+                    f"Use `!rate [1.0-10.0] {movie_pick.movie_title}` to rate this movie",
+                    False,
+                ),
+            ),
+        )
+
+        await ctx.send(embed=embed)
 
     @commands.command(name="delete_pick")
     @commands.has_permissions(administrator=True)
@@ -507,13 +762,13 @@ class AdminCommands(commands.Cog):
                 embed = discord.Embed(
                     title="✅ Movie Pick Deleted",
                     description=f"Deleted movie pick with ID {movie_id}",
-                    color=0x00FF00,
+                    color=_COLOR_OK,
                 )
             else:
                 embed = discord.Embed(
                     title="❌ Movie Pick Not Found",
                     description=f"No movie pick found with ID {movie_id}",
-                    color=0xFF0000,
+                    color=_COLOR_ERR,
                 )
 
             await ctx.send(embed=embed)
@@ -526,78 +781,72 @@ class AdminCommands(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def force_pick(self, ctx, username: str, *, movie_input: str):
         """Force a movie pick for any user (Admin only)"""
-        try:
-            from utils.parsers import parse_movie_input
+        # Parse movie input
+        movie_name, year = parse_movie_input(movie_input)
 
-            # Parse movie input
-            movie_name, year = parse_movie_input(movie_input)
+        try:
+            # Get the user and the period they would be picking for
+            user, (current_user, _, _), (next_user, _, _) = await asyncio.gather(
+                self.rotation_service.get_user_by_username(username),
+                self.rotation_service.get_current_picker(),
+                self.rotation_service.get_next_picker(),
+            )
+        except Exception as e:
+            logger.exception("Error forcing pick")
+            await ctx.send(f"❌ Error forcing pick: {str(e)}")
+            return
 
-            # Get user
-            user = await self.rotation_service.get_user_by_username(username)
-            if not user:
-                await ctx.send(f"❌ User @{username} not found")
-                return
+        if not user:
+            await ctx.send(f"❌ User @{username} not found")
+            return
 
-            # Search for movie
-            search_msg = await ctx.send(f"🔍 Searching for **{movie_name}**...")
-            success, message, movie_details = await self.movie_service.search_movie(
-                movie_name, year
+        # Force the pick for the appropriate period
+        if user.id == current_user.id:
+            is_early_access = False
+            period_text = "current period"
+        elif user.id == next_user.id:
+            is_early_access = True
+            period_text = "next period (early access)"
+        else:
+            await ctx.send(
+                f"❌ {user.real_name} is not current or next in rotation. Use `!add_historical_pick` for past picks."
             )
+            return
 
-            if not success or not movie_details:
-                await search_msg.edit(content=message)
-                return
-
-            # Extract movie info
-            movie_info = self.movie_service.extract_movie_info(movie_details)
+        # Search for movie
+        search_msg = await ctx.send(f"🔍 Searching for **{movie_name}**...")
+        success, message, movie_details = await self.movie_service.search_movie(
+            movie_name, year
+        )
 
-            # Determine the period for this user
-            current_user, current_start, current_end = (
-                await self.rotation_service.get_current_picker()
-            )
+        if not success or not movie_details:
+            await search_msg.edit(content=message)
+            return
 
-            # Force the pick for the appropriate period
-            if user.id == current_user.id:
-                # Current picker
-                movie_pick = await self.rotation_service.add_or_update_movie_pick(
-                    username=username,
-                    movie_title=movie_info["title"],
-                    movie_year=movie_info["year"],
-                    imdb_id=movie_info["imdb_id"],
-                    movie_details=movie_info,
-                    is_early_access=False,
-                )
-                period_text = "current period"
-            else:
-                # Check if they're next
-                next_user, _, _ = await self.rotation_service.get_next_picker()
-                if user.id == next_user.id:
-                    movie_pick = await self.rotation_service.add_or_update_movie_pick(
-                        username=username,
-                        movie_title=movie_info["title"],
-                        movie_year=movie_info["year"],
-                        imdb_id=movie_info["imdb_id"],
-                        movie_details=movie_info,
-                        is_early_access=True,
-                    )
-                    period_text = "next period (early access)"
-                else:
-                    await search_msg.edit(
-                        content=f"❌ {user.real_name} is not current or next in rotation. Use `!add_historical_pick` for past picks."
-                    )
-                    return
+        # Extract movie info
+        movie_info = self.movie_service.extract_movie_info(movie_details)
 
-            embed = discord.Embed(
-                title="✅ Movie Pick Forced",
-                description=f"Set **{movie_info['title']}** as {user.real_name}'s pick for {period_text}",
-                color=0x00FF00,
+        try:
+            await self.rotation_service.add_or_update_movie_pick(
+                username=user.discord_username,
+                movie_title=movie_info["title"],
+                movie_year=movie_info["year"],
+                imdb_id=movie_info["imdb_id"],
+                movie_details=movie_info,
+                is_early_access=is_early_access,
             )
+        except Exception as e:
+            logger.exception("Error forcing pick")
+            await search_msg.edit(content=f"❌ Error forcing pick: {str(e)}")
+            return
 
-            await search_msg.edit(content="", embed=embed)
+        embed = discord.Embed(
+            title="✅ Movie Pick Forced",
+            description=f"Set **{movie_info['title']}** as {user.real_name}'s pick for {period_text}",
+            color=_COLOR_OK,
+        )
 
-        except Exception as e:
-            logger.error(f"Error forcing pick: {e}")
-            await ctx.send(f"❌ Error forcing pick: {str(e)}")
+        await search_msg.edit(content="", embed=embed)
 
     @commands.command(name="reset_rotation")
     @commands.has_permissions(administrator=True)
@@ -607,24 +856,12 @@ class AdminCommands(commands.Cog):
         embed = discord.Embed(
             title="⚠️ Reset Rotation",
             description="This will delete ALL rotation data including picks and ratings!\n\nType `CONFIRM RESET` to proceed.",
-            color=0xFF6600,
+            color=_COLOR_WARN,
         )
 
-        confirmation_msg = await ctx.send(embed=embed)
-
-        def check(m):
-            return (
-                m.author == ctx.author
-                and m.channel == ctx.channel
-                and m.content == "CONFIRM RESET"
-            )
-
-        try:
-            await self.bot.wait_for("message", check=check, timeout=30.0)
-        except:
-            await confirmation_msg.edit(
-                content="❌ Reset cancelled (timed out)", embed=None
-            )
+        if not await self._await_confirmation(
+            ctx, embed, "CONFIRM RESET", "❌ Reset cancelled (timed out)"
+        ):
             return
 
         try:
@@ -633,7 +870,7 @@ class AdminCommands(commands.Cog):
             embed = discord.Embed(
                 title="✅ Rotation Reset Complete",
                 description="All rotation data has been cleared. Use `!setup_rotation` to start fresh.",
-                color=0x00FF00,
+                color=_COLOR_OK,
             )
 
             await ctx.send(embed=embed)
@@ -647,36 +884,42 @@ class AdminCommands(commands.Cog):
     async def admin_stats(self, ctx):
         """Show admin statistics (Admin only)"""
         try:
-            stats = await self.rotation_service.get_admin_stats()
-
-            embed = discord.Embed(title="📊 Admin Statistics", color=0x0099FF)
-
-            embed.add_field(
-                name="Users",
-                value=f"Total: {stats['total_users']}\nActive: {stats['active_users']}",
-                inline=True,
-            )
-
-            embed.add_field(
-                name="Movies",
-                value=f"Total Picks: {stats['total_picks']}\nRated Movies: {stats['rated_movies']}",
-                inline=True,
+            stats, current_pick = await asyncio.gather(
+                self.rotation_service.get_admin_stats(),
+                self.rotation_service.get_current_movie_pick(),
             )
 
-            embed.add_field(
-                name="Ratings",
-                value=f"Total: {stats['total_ratings']}\nAvg Rating: {stats['average_rating']:.1f}/10",
-                inline=True,
-            )
-
-            embed.add_field(
-                name="Current Rotation",
-                value=f"Period: {stats['current_period']}\nDays Remaining: {stats['days_remaining']}",
-                inline=False,
+            embed = _embed(
+                "📊 Admin Statistics",
+                fields=(
+                    (
+                        "Users",
+                        f"Total: {stats['total_users']}\n"
+                        f"Active: {stats['active_users']}",
+                        True,
+                    ),
+                    (
+                        "Movies",
+                        f"Total Picks: {stats['total_picks']}\n"
+                        f"Rated Movies: {stats['rated_movies']}",
+                        True,
+                    ),
+                    (
+                        "Ratings",
+                        f"Total: {stats['total_ratings']}\n"
+                        f"Avg Rating: {stats['average_rating']:.1f}/10",
+                        True,
+                    ),
+                    (
+                        "Current Rotation",
+                        f"Period: {stats['current_period']}\n"
+                        f"Days Remaining: {stats['days_remaining']}",
+                        False,
+                    ),
+                ),
             )
 
             # Add current movie info
-            current_pick = await self.rotation_service.get_current_movie_pick()
             if current_pick:
                 movie_text = current_pick.movie_title
                 if current_pick.movie_year:
@@ -702,24 +945,9 @@ class AdminCommands(commands.Cog):
                 !add_user john "John Smith"
         """
         try:
-            # Clean up the discord tag (remove @ and any <@> wrapper)
-            discord_username = discord_tag.strip()
-            if discord_username.startswith("<@") and discord_username.endswith(">"):
-                # This is a mention, we need to get the actual username
-                user_id = (
-                    discord_username.replace("<@", "").replace(">", "").replace("!", "")
-                )
-                try:
-                    user = await self.bot.fetch_user(int(user_id))
-                    discord_username = user.name
-                except:
-                    await ctx.send(
-                        f"❌ Could not find user with that mention. Try using their username directly."
-                    )
-                    return
-            else:
-                # Remove @ if present
-                discord_username = discord_username.lstrip("@")
+            discord_username = await self._username_arg(ctx, discord_tag)
+            if discord_username is None:
+                return
 
             # Validate inputs
             if not discord_username:
@@ -743,7 +971,7 @@ class AdminCommands(commands.Cog):
                 embed = discord.Embed(
                     title="✅ User Added to Rotation",
                     description=message,
-                    color=0x00FF00,
+                    color=_COLOR_OK,
                 )
 
                 embed.add_field(
@@ -777,7 +1005,7 @@ class AdminCommands(commands.Cog):
 
             else:
                 embed = discord.Embed(
-                    title="❌ Failed to Add User", description=message, color=0xFF0000
+                    title="❌ Failed to Add User", description=message, color=_COLOR_ERR
                 )
                 await ctx.send(embed=embed)
 
@@ -799,23 +1027,9 @@ class AdminCommands(commands.Cog):
                 !remove_user john
         """
         try:
-            # Clean up the discord tag
-            discord_username = discord_tag.strip()
-            if discord_username.startswith("<@") and discord_username.endswith(">"):
-                # This is a mention, get the actual username
-                user_id = (
-                    discord_username.replace("<@", "").replace(">", "").replace("!", "")
-                )
-                try:
-                    user = await self.bot.fetch_user(int(user_id))
-                    discord_username = user.name
-                except:
-                    await ctx.send(
-                        f"❌ Could not find user with that mention. Try using their username directly."
-                    )
-                    return
-            else:
-                discord_username = discord_username.lstrip("@")
+            discord_username = await self._username_arg(ctx, discord_tag)
+            if discord_username is None:
+                return
 
             # Get user info before removal for confirmation
             user_to_remove = await self.rotation_service.get_user_by_username(
@@ -841,7 +1055,7 @@ class AdminCommands(commands.Cog):
                     f"• ✅ Historical records are maintained\n\n"
                     f"They can be reactivated later if needed."
                 ),
-                color=0xFF6600,
+                color=_COLOR_WARN,
             )
 
             confirm_embed.add_field(
@@ -850,21 +1064,9 @@ class AdminCommands(commands.Cog):
                 inline=False,
             )
 
-            confirmation_msg = await ctx.send(embed=confirm_embed)
-
-            def check(m):
-                return (
-                    m.author == ctx.author
-                    and m.channel == ctx.channel
-                    and m.content == "CONFIRM REMOVE"
-                )
-
-            try:
-                await self.bot.wait_for("message", check=check, timeout=30.0)
-            except:
-                await confirmation_msg.edit(
-                    content="❌ Removal cancelled (timed out)", embed=None
-                )
+            if not await self._await_confirmation(
+                ctx, confirm_embed, "CONFIRM REMOVE", "❌ Removal cancelled (timed out)"
+            ):
                 return
 
             # Perform the removal
@@ -878,7 +1080,7 @@ class AdminCommands(commands.Cog):
                 result_embed = discord.Embed(
                     title="✅ User Removed from Active Rotation",
                     description=message,
-                    color=0x00FF00,
+                    color=_COLOR_OK,
                 )
 
                 result_embed.add_field(
@@ -931,7 +1133,7 @@ class AdminCommands(commands.Cog):
                 error_embed = discord.Embed(
                     title="❌ Failed to Remove User",
                     description=message,
-                    color=0xFF0000,
+                    color=_COLOR_ERR,
                 )
                 await ctx.send(embed=error_embed)
 
@@ -952,22 +1154,9 @@ class AdminCommands(commands.Cog):
                 !reactivate_user @john 3     # Inserts at position 3
         """
         try:
-            # Clean up the discord tag
-            discord_username = discord_tag.strip()
-            if discord_username.startswith("<@") and discord_username.endswith(">"):
-                user_id = (
-                    discord_username.replace("<@", "").replace(">", "").replace("!", "")
-                )
-                try:
-                    user = await self.bot.fetch_user(int(user_id))
-                    discord_username = user.name
-                except:
-                    await ctx.send(
-                        f"❌ Could not find user with that mention. Try using their username directly."
-                    )
-                    return
-            else:
-                discord_username = discord_username.lstrip("@")
+            discord_username = await self._username_arg(ctx, discord_tag)
+            if discord_username is None:
+                return
 
             # Convert position to 0-based if provided
             if position is not None:
@@ -983,7 +1172,7 @@ class AdminCommands(commands.Cog):
 
             if success:
                 embed = discord.Embed(
-                    title="✅ User Reactivated", description=message, color=0x00FF00
+                    title="✅ User Reactivated", description=message, color=_COLOR_OK
                 )
 
                 embed.add_field(
@@ -1021,7 +1210,7 @@ class AdminCommands(commands.Cog):
                 embed = discord.Embed(
                     title="❌ Failed to Reactivate User",
                     description=message,
-                    color=0xFF0000,
+                    color=_COLOR_ERR,
                 )
                 await ctx.send(embed=embed)
 
@@ -1042,26 +1231,29 @@ class AdminCommands(commands.Cog):
                 await ctx.send("No inactive users with preserved history.")
                 return
 
-            embed = discord.Embed(
-                title="📋 Inactive Users (Removed from Rotation)",
-                description=f"Total: {len(inactive_users)} inactive members with preserved history",
-                color=0x808080,
-            )
-
+            fields = []
             for user in inactive_users:
                 value = f"@{user['username']}"
                 if user["picks"] > 0 or user["ratings"] > 0:
                     value += f"\n📊 {user['picks']} picks, {user['ratings']} ratings"
 
-                embed.add_field(name=user["real_name"], value=value, inline=True)
+                fields.append((user["real_name"], value, True))
 
-            embed.add_field(
-                name="Reactivation",
-                value="Use `!reactivate_user @username` to add them back to rotation",
-                inline=False,
+            fields.append(
+                (
+                    "Reactivation",
+                    "Use `!reactivate_user @username` to add them back to rotation",
+                    False,
+                )
             )
 
-            await ctx.send(embed=embed)
+            await _send_fields(
+                ctx,
+                "📋 Inactive Users (Removed from Rotation)",
+                f"Total: {len(inactive_users)} inactive members with preserved history",
+                _COLOR_MUTED,
+                fields,
+            )
 
         except Exception as e:
             logger.error(f"Error listing inactive users: {e}")
@@ -1073,64 +1265,80 @@ class AdminCommands(commands.Cog):
         """
         List all users in the rotation with their positions (Admin only)
         """
-        session = self.rotation_service.db.get_session()
         try:
-            # Import models here
-            from models.database import User, MoviePick
+            loop = asyncio.get_running_loop()
+            rows_future = loop.run_in_executor(None, self._load_rotation_members)
 
-            users = session.query(User).order_by(User.rotation_position).all()
+            # Get current and next picker for context
+            current_res, next_res = await asyncio.gather(
+                self.rotation_service.get_current_picker(),
+                self.rotation_service.get_next_picker(),
+                return_exceptions=True,
+            )
+            rows = await rows_future
 
-            if not users:
+            if not rows:
                 await ctx.send(
                     "❌ No users in rotation. Use `!setup_rotation` to add users."
                 )
                 return
 
-            embed = discord.Embed(
-                title="👥 Rotation Members",
-                description=f"Total: {len(users)} members",
-                color=0x0099FF,
-            )
+            # Status suffix by user id; current wins if it is also next
+            statuses = {}
+            if not isinstance(current_res, Exception) and not isinstance(
+                next_res, Exception
+            ):
+                statuses[next_res[0].id] = " ⏭️ *Next*"
+                statuses[current_res[0].id] = " 🎯 **CURRENT**"
 
-            # Get current and next picker for context
-            try:
-                current_user, _, _ = await self.rotation_service.get_current_picker()
-                next_user, _, _ = await self.rotation_service.get_next_picker()
-            except:
-                current_user = None
-                next_user = None
-
-            for user in users:
-                status = ""
-                if current_user and user.id == current_user.id:
-                    status = " 🎯 **CURRENT**"
-                elif next_user and user.id == next_user.id:
-                    status = " ⏭️ *Next*"
-
-                # Get pick count for this user
-                pick_count = (
-                    session.query(MoviePick)
-                    .filter(MoviePick.picker_user_id == user.id)
-                    .count()
-                )
+            fields = []
+            for user in rows:
+                status = statuses.get(user.id, "")
 
                 value = f"@{user.discord_username}"
-                if pick_count > 0:
-                    value += f"\n📊 {pick_count} pick{'s' if pick_count != 1 else ''}"
-
-                embed.add_field(
-                    name=f"#{user.rotation_position + 1}. {user.real_name}{status}",
-                    value=value,
-                    inline=True,
+                if user.pick_count > 0:
+                    value += f"\n📊 {user.pick_count} pick{'s' if user.pick_count != 1 else ''}"
+
+                fields.append(
+                    (
+                        f"#{user.rotation_position + 1}. {user.real_name}{status}",
+                        value,
+                        True,
+                    )
                 )
 
-            await ctx.send(embed=embed)
+            await _send_fields(
+                ctx,
+                "👥 Rotation Members",
+                f"Total: {len(rows)} members",
+                _COLOR_INFO,
+                fields,
+            )
 
         except Exception as e:
             logger.error(f"Error listing users: {e}")
             await ctx.send(f"❌ Error listing users: {str(e)}")
-        finally:
-            session.close()
+
+    def _load_rotation_members(self):
+        """Load every user with their pick count, ordered by rotation position
+
+        Returns column rows so they stay usable after the session closes. Runs
+        in an executor so the query doesn't block the event loop.
+        """
+        with self.rotation_service.db.session_scope() as session:
+            return (
+                session.query(
+                    User.id,
+                    User.discord_username,
+                    User.real_name,
+                    User.rotation_position,
+                    func.count(MoviePick.id).label("pick_count"),
+                )
+                .outerjoin(MoviePick, MoviePick.picker_user_id == User.id)
+                .group_by(User.id)
+                .order_by(User.rotation_position)
+                .all()
+            )
 
     @commands.command(name="swap_users")
     @commands.has_permissions(administrator=True)
@@ -1144,40 +1352,22 @@ class AdminCommands(commands.Cog):
         Example: !swap_users @john @jane
                 !swap_users john jane
         """
-        session = self.rotation_service.db.get_session()
         try:
-            # Import User model here
-            from models.database import User
-
             # Clean up usernames
-            username1 = user1.strip().lstrip("@")
-            username2 = user2.strip().lstrip("@")
-
-            # Handle mentions
-            if username1.startswith("<@") and username1.endswith(">"):
-                user_id = username1.replace("<@", "").replace(">", "").replace("!", "")
-                try:
-                    user = await self.bot.fetch_user(int(user_id))
-                    username1 = user.name
-                except:
-                    await ctx.send(f"❌ Could not find first user")
-                    return
-
-            if username2.startswith("<@") and username2.endswith(">"):
-                user_id = username2.replace("<@", "").replace(">", "").replace("!", "")
-                try:
-                    user = await self.bot.fetch_user(int(user_id))
-                    username2 = user.name
-                except:
-                    await ctx.send(f"❌ Could not find second user")
-                    return
+            username1 = await self._username_arg(
+                ctx, user1, "❌ Could not find first user"
+            )
+            if username1 is None:
+                return
 
-            # Find both users
-            user1_obj = (
-                session.query(User).filter(User.discord_username == username1).first()
+            username2 = await self._username_arg(
+                ctx, user2, "❌ Could not find second user"
             )
-            user2_obj = (
-                session.query(User).filter(User.discord_username == username2).first()
+            if username2 is None:
+                return
+
+            user1_obj, user2_obj = await asyncio.get_running_loop().run_in_executor(
+                None, self._swap_positions, username1, username2
             )
 
             if not user1_obj:
@@ -1188,19 +1378,15 @@ class AdminCommands(commands.Cog):
                 await ctx.send(f"❌ User @{username2} not found in rotation")
                 return
 
-            # Swap their positions
+            self.rotation_service.rotation_version += 1
+
             pos1 = user1_obj.rotation_position
             pos2 = user2_obj.rotation_position
 
-            user1_obj.rotation_position = pos2
-            user2_obj.rotation_position = pos1
-
-            session.commit()
-
             embed = discord.Embed(
                 title="✅ Users Swapped",
                 description="Successfully swapped rotation positions",
-                color=0x00FF00,
+                color=_COLOR_OK,
             )
 
             embed.add_field(
@@ -1228,11 +1414,47 @@ class AdminCommands(commands.Cog):
             )
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Error swapping users: {e}")
             await ctx.send(f"❌ Error swapping users: {str(e)}")
-        finally:
-            session.close()
+
+    def _swap_positions(self, username1, username2):
+        """Swap the rotation positions of two users
+
+        Returns the two users' rows as they were before the swap; either is
+        None if that user doesn't exist, in which case nothing is changed.
+        Runs in an executor so the queries don't block the event loop.
+        """
+        with self.rotation_service.db.session_scope() as session:
+            # Find both users in one query
+            by_name = {
+                user.discord_username.lower(): user
+                for user in session.query(
+                    User.id,
+                    User.discord_username,
+                    User.real_name,
+                    User.rotation_position,
+                ).filter(
+                    func.lower(User.discord_username).in_(
+                        (username1.lower(), username2.lower())
+                    )
+                )
+            }
+            user1 = by_name.get(username1.lower())
+            user2 = by_name.get(username2.lower())
+            if not user1 or not user2:
+                return user1, user2
+
+            positions = {
+                user1.id: user2.rotation_position,
+                user2.id: user1.rotation_position,
+            }
+            session.execute(
+                update(User)
+                .where(User.id.in_(positions))
+                .values(rotation_position=case(positions, value=User.id)),
+                execution_options={"synchronize_session": False},
+            )
+            return user1, user2
 
     @commands.command(name="fix_rotation_order")
     @commands.has_permissions(administrator=True)
@@ -1245,76 +1467,54 @@ class AdminCommands(commands.Cog):
 
         Example: !fix_rotation_order j,kyle,dennis,paul,derek,greg,gavin,baldo
         """
-        session = self.rotation_service.db.get_session()
-        try:
-            # Import User model from database
-            from models.database import User
-
-            # Parse the new order
-            usernames = [u.strip().lower() for u in new_order.split(",")]
+        # Parse the new order
+        usernames = [u.strip().lower() for u in new_order.split(",")]
 
-            if len(usernames) < 2:
-                await ctx.send(
-                    "❌ Please provide at least 2 users in the rotation order"
-                )
-                return
+        if len(usernames) < 2:
+            await ctx.send("❌ Please provide at least 2 users in the rotation order")
+            return
 
-            # Verify all users exist
-            all_users = (
-                session.query(User).filter(User.rotation_position.isnot(None)).all()
+        try:
+            loop = asyncio.get_running_loop()
+            members, unknown, missing = await loop.run_in_executor(
+                None, self._check_rotation_order, usernames
             )
-            existing_usernames = {u.discord_username.lower(): u for u in all_users}
 
-            # Check for missing users
-            for username in usernames:
-                if username not in existing_usernames:
-                    await ctx.send(f"❌ User @{username} not found in active rotation")
-                    return
-
-            # Check if we're missing anyone
-            missing = []
-            for existing_username in existing_usernames:
-                if existing_username not in usernames:
-                    missing.append(existing_username)
+            if unknown:
+                await ctx.send(f"❌ User @{unknown} not found in active rotation")
+                return
 
+            # Ask with no session open, the reply can take up to 30 seconds
             if missing:
-                await ctx.send(
-                    f"⚠️ These active users were not included: {', '.join(missing)}\nContinue anyway? Type `YES` to proceed"
-                )
-
-                def check(m):
-                    return (
-                        m.author == ctx.author
-                        and m.channel == ctx.channel
-                        and m.content == "YES"
-                    )
-
-                try:
-                    await self.bot.wait_for("message", check=check, timeout=30.0)
-                except:
-                    await ctx.send("❌ Operation cancelled")
+                if not await self._await_confirmation(
+                    ctx,
+                    f"⚠️ These active users were not included: {', '.join(missing)}\nContinue anyway? Type `YES` to proceed",
+                    "YES",
+                    "❌ Operation cancelled",
+                ):
                     return
 
-            # Update rotation positions
-            for new_position, username in enumerate(usernames):
-                user = existing_usernames[username]
-                user.rotation_position = new_position
+            ordered_users = [members[username] for username in usernames]
+            await loop.run_in_executor(
+                None,
+                self._apply_rotation_order,
+                {user.id: position for position, user in enumerate(ordered_users)},
+            )
+            self.rotation_service.rotation_version += 1
 
-            session.commit()
+            # Show the new order
+            order_text = "\n".join(
+                f"#{i}. {user.real_name} (@{user.discord_username})"
+                for i, user in enumerate(ordered_users, 1)
+            )
 
             # Create confirmation embed
             embed = discord.Embed(
                 title="✅ Rotation Order Fixed",
                 description=f"Updated rotation positions for {len(usernames)} users",
-                color=0x00FF00,
+                color=_COLOR_OK,
             )
 
-            # Show the new order
-            order_text = ""
-            for i, username in enumerate(usernames, 1):
-                user = existing_usernames[username]
-                order_text += f"#{i}. {user.real_name} (@{user.discord_username})\n"
-
             embed.add_field(
                 name="New Rotation Order",
                 value=order_text[:1024],  # Truncate if too long
@@ -1332,11 +1532,44 @@ class AdminCommands(commands.Cog):
             logger.info(f"{ctx.author.name} manually fixed rotation order")
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Error fixing rotation order: {e}")
             await ctx.send(f"❌ Error fixing rotation order: {str(e)}")
-        finally:
-            session.close()
+
+    def _check_rotation_order(self, usernames):
+        """Match a requested rotation order against the active members
+
+        Returns (members, unknown, missing): members maps lowercased usernames
+        to their rows, unknown is the first requested name that isn't active
+        (or None) and missing lists active members left out of the order.
+        Runs in an executor so the query doesn't block the event loop.
+        """
+        with self.rotation_service.db.session_scope() as session:
+            # Only the columns used by fix_rotation_order are loaded
+            active_users = (
+                session.query(User.id, User.discord_username, User.real_name)
+                .filter(User.rotation_position.isnot(None))
+                .all()
+            )
+
+        members = {u.discord_username.lower(): u for u in active_users}
+        unknown = next((name for name in usernames if name not in members), None)
+        requested = set(usernames)
+        missing = [name for name in members if name not in requested]
+        return members, unknown, missing
+
+    def _apply_rotation_order(self, positions):
+        """Set every user's rotation position from a user id -> position map
+
+        Runs in an executor so the update doesn't block the event loop.
+        """
+        with self.rotation_service.db.session_scope() as session:
+            # Update every rotation position in one statement
+            session.execute(
+                update(User)
+                .where(User.id.in_(positions))
+                .values(rotation_position=case(positions, value=User.id)),
+                execution_options={"synchronize_session": False},
+            )
 
     @commands.command(name="set_rotation_date")
     @commands.has_permissions(administrator=True)
@@ -1349,8 +1582,6 @@ class AdminCommands(commands.Cog):
             !set_rotation_date 2025-10-06
         """
         try:
-            from utils.date_utils import parse_date
-
             new_date = parse_date(date_str)
             if not new_date:
                 await ctx.send(
@@ -1364,7 +1595,7 @@ class AdminCommands(commands.Cog):
             embed = discord.Embed(
                 title="✅ Rotation Start Date Updated",
                 description=f"Rotation now starts on {new_date.strftime('%B %d, %Y')}",
-                color=0x00FF00,
+                color=_COLOR_OK,
             )
 
             embed.add_field(
@@ -2,14 +2,19 @@
 Movie selection and management commands (Updated - No Movie ID references)
 """
 
+import asyncio
 import discord
 from discord.ext import commands
 import logging
+import time
 from utils.parsers import parse_movie_input
 from utils.embeds import create_movie_embed
 
 logger = logging.getLogger(__name__)
 
+# How long the status commands reuse the current picker and pick (seconds)
+_RECENT_TTL = 30.0
+
 
 class MovieCommands(commands.Cog):
     """Commands for movie selection and management"""
@@ -18,6 +23,40 @@ class MovieCommands(commands.Cog):
         self.bot = bot
         self.movie_service = bot.services["movie"]
         self.rotation_service = bot.services["rotation"]
+        # name -> (expires_at, rotation service versions, result) for _recent
+        self._recent_results = {}
+
+    async def _recent(self, name, fetch):
+        """Await fetch(), reusing its result from the last _RECENT_TTL seconds
+
+        Results are dropped early when a skip, a pick or the rotation order
+        changes, so bursts of status commands share one lookup.
+        """
+        version = (
+            self.rotation_service.skips_version,
+            self.rotation_service.picks_version,
+            self.rotation_service.rotation_version,
+        )
+        now = time.monotonic()
+        entry = self._recent_results.get(name)
+        if entry is not None and entry[0] > now and entry[1] == version:
+            return entry[2]
+
+        result = await fetch()
+        self._recent_results[name] = (now + _RECENT_TTL, version, result)
+        return result
+
+    async def _current_picker(self):
+        """Current (user, start, end), shared by recent status commands"""
+        return await self._recent(
+            "current_picker", self.rotation_service.get_current_picker
+        )
+
+    async def _current_movie_pick(self):
+        """Current period's pick, shared by recent status commands"""
+        return await self._recent(
+            "current_movie_pick", self.rotation_service.get_current_movie_pick
+        )
 
     @commands.command(name="pick_movie")
     async def pick_movie(self, ctx, *, movie_input: str):
@@ -55,21 +94,22 @@ class MovieCommands(commands.Cog):
         search_msg = await ctx.send(f"🔍 Searching for {search_text}...")
 
         try:
-            # Search for movie
-            success, message, movie_details = await self.movie_service.search_movie(
-                movie_name, year
+            # Search for the movie while looking up the current picker and
+            # the user, which decide whether this is an early access pick
+            (
+                (success, message, movie_details),
+                (current_user, current_start, current_end),
+                user,
+            ) = await asyncio.gather(
+                self.movie_service.search_movie(movie_name, year),
+                self.rotation_service.get_current_picker(),
+                self.rotation_service.get_user_by_username(username),
             )
 
             if success and movie_details:
                 # Extract movie info for database
                 movie_info = self.movie_service.extract_movie_info(movie_details)
 
-                # Determine if this is an early access pick
-                current_user, current_start, current_end = (
-                    await self.rotation_service.get_current_picker()
-                )
-                user = await self.rotation_service.get_user_by_username(username)
-
                 is_early_access = (
                     user.id != current_user.id and "Early access" in reason
                 )
@@ -141,10 +181,10 @@ class MovieCommands(commands.Cog):
         """Display the currently selected movie with details"""
         try:
             # Get the current picker's movie
-            current_movie_pick = await self.rotation_service.get_current_movie_pick()
+            current_movie_pick = await self._current_movie_pick()
 
             if not current_movie_pick:
-                current_user, _, _ = await self.rotation_service.get_current_picker()
+                current_user, _, _ = await self._current_picker()
                 await ctx.send(
                     f"No movie has been selected yet. {current_user.real_name} (@{current_user.discord_username}) needs to pick a movie!\n"
                     f"Use `!pick_movie [name]` to pick one!"
@@ -201,7 +241,7 @@ class MovieCommands(commands.Cog):
     async def movie_status(self, ctx):
         """Quick status of current movie"""
         try:
-            current_movie_pick = await self.rotation_service.get_current_movie_pick()
+            current_movie_pick = await self._current_movie_pick()
 
             if current_movie_pick:
                 movie_title = current_movie_pick.movie_title
@@ -211,7 +251,7 @@ class MovieCommands(commands.Cog):
                     f"🎬 Current: **{movie_title}** (picked by {current_movie_pick.picker.real_name})"
                 )
             else:
-                current_user, _, _ = await self.rotation_service.get_current_picker()
+                current_user, _, _ = await self._current_picker()
                 await ctx.send(
                     f"🎬 No movie selected - waiting for {current_user.real_name} to pick"
                 )
@@ -260,8 +300,13 @@ class MovieCommands(commands.Cog):
         username = ctx.author.name
 
         try:
-            # Get user's active pick (either current or future)
-            user_pick = await self.rotation_service.get_user_active_pick(username)
+            # Get user's active pick (either current or future), and who is
+            # picking now to tell the two apart
+            user_pick, (current_user, _, _), user = await asyncio.gather(
+                self.rotation_service.get_user_active_pick(username),
+                self._current_picker(),
+                self.rotation_service.get_user_by_username(username),
+            )
 
             if not user_pick:
                 await ctx.send(
@@ -274,9 +319,6 @@ class MovieCommands(commands.Cog):
                 movie_title += f" ({user_pick.movie_year})"
 
             # Check if it's a future pick
-            current_user, _, _ = await self.rotation_service.get_current_picker()
-            user = await self.rotation_service.get_user_by_username(username)
-
             if user.id != current_user.id:
                 # It's a future pick
                 embed = discord.Embed(
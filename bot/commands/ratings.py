@@ -5,6 +5,7 @@ Movie rating system commands - Updated for float ratings and movie titles
 import discord
 from discord.ext import commands
 import logging
+from models.database import MoviePick
 from utils.parsers import (
     parse_movie_title_and_review,
     validate_rating,
@@ -13,6 +14,41 @@ from utils.parsers import (
 
 logger = logging.getLogger(__name__)
 
+# Reply when a rating fails validate_rating
+_RATING_RANGE_ERROR = "❌ Rating must be between 1.0 and 10.0!"
+
+# Hint pointing at the full ratings list for a movie
+_VIEW_ALL_NAME = "View All Ratings"
+_VIEW_ALL_VALUE_FMT = "Use `!movie_ratings {}` to see all ratings"
+
+# rate_help never changes, so its (name, value) fields are built once
+_RATE_HELP_FIELDS = (
+    (
+        "Rate a Movie",
+        "`!rate 8.5 The Matrix`\n`!rate 9.2 Blade Runner 2049 Amazing visuals!`",
+    ),
+    (
+        "View Ratings",
+        "`!movie_ratings The Matrix`\n`!my_ratings`\n`!top_rated`",
+    ),
+    (
+        "Update/Delete",
+        "`!update_rating 9.0 The Matrix`\n`!delete_rating The Matrix`",
+    ),
+    (
+        "Statistics",
+        "`!rating_stats` - Your stats\n`!recent_ratings` - Latest ratings",
+    ),
+    (
+        "Rating Scale",
+        "1.0 - 10.0 (decimals allowed)\n1.0 = Terrible, 5.0 = Average, 10.0 = Perfect",
+    ),
+    (
+        "Tips",
+        "• Movie titles are fuzzy matched - close spellings work\n• Reviews are optional but encouraged\n• You can update ratings anytime",
+    ),
+)
+
 
 class RatingCommands(commands.Cog):
     """Commands for movie rating system"""
@@ -29,7 +65,7 @@ class RatingCommands(commands.Cog):
                 limit=100
             )  # Get many movies
             return [pick.movie_title for pick in recent_picks]
-        except:
+        except Exception:
             return []
 
     async def _find_movie_by_title(self, search_title: str) -> tuple[str, str]:
@@ -39,8 +75,6 @@ class RatingCommands(commands.Cog):
         """
         session = self.rating_service.db.get_session()
         try:
-            from models.database import MoviePick
-
             # Try exact match first (case insensitive)
             movie_pick = (
                 session.query(MoviePick)
@@ -91,7 +125,7 @@ class RatingCommands(commands.Cog):
 
         # Validate rating
         if not validate_rating(rating):
-            await ctx.send(f"❌ Rating must be between 1.0 and 10.0!")
+            await ctx.send(_RATING_RANGE_ERROR)
             return
 
         if not movie_and_review:
@@ -129,8 +163,8 @@ class RatingCommands(commands.Cog):
                 )
 
             embed.add_field(
-                name="View All Ratings",
-                value=f"Use `!movie_ratings {actual_title}` to see all ratings",
+                name=_VIEW_ALL_NAME,
+                value=_VIEW_ALL_VALUE_FMT.format(actual_title),
                 inline=False,
             )
 
@@ -160,7 +194,7 @@ class RatingCommands(commands.Cog):
         username = ctx.author.name
 
         try:
-            ratings = await self.rating_service.get_user_ratings(username)
+            ratings = await self.rating_service.get_user_ratings(username, limit=10)
 
             if not ratings:
                 await ctx.send("You haven't rated any movies yet!")
@@ -174,7 +208,7 @@ class RatingCommands(commands.Cog):
                 title=f"🎬 {user_name}'s Recent Ratings", color=0x0099FF
             )
 
-            for rating in ratings[:10]:  # Show last 10 ratings
+            for rating in ratings:
                 movie_title = rating.movie_pick.movie_title
                 if rating.movie_pick.movie_year:
                     movie_title += f" ({rating.movie_pick.movie_year})"
@@ -270,7 +304,7 @@ class RatingCommands(commands.Cog):
         username = ctx.author.name
 
         if not validate_rating(new_rating):
-            await ctx.send(f"❌ Rating must be between 1.0 and 10.0!")
+            await ctx.send(_RATING_RANGE_ERROR)
             return
 
         try:
@@ -403,41 +437,8 @@ class RatingCommands(commands.Cog):
             color=0x0099FF,
         )
 
-        embed.add_field(
-            name="Rate a Movie",
-            value="`!rate 8.5 The Matrix`\n`!rate 9.2 Blade Runner 2049 Amazing visuals!`",
-            inline=False,
-        )
-
-        embed.add_field(
-            name="View Ratings",
-            value="`!movie_ratings The Matrix`\n`!my_ratings`\n`!top_rated`",
-            inline=False,
-        )
-
-        embed.add_field(
-            name="Update/Delete",
-            value="`!update_rating 9.0 The Matrix`\n`!delete_rating The Matrix`",
-            inline=False,
-        )
-
-        embed.add_field(
-            name="Statistics",
-            value="`!rating_stats` - Your stats\n`!recent_ratings` - Latest ratings",
-            inline=False,
-        )
-
-        embed.add_field(
-            name="Rating Scale",
-            value="1.0 - 10.0 (decimals allowed)\n1.0 = Terrible, 5.0 = Average, 10.0 = Perfect",
-            inline=False,
-        )
-
-        embed.add_field(
-            name="Tips",
-            value="• Movie titles are fuzzy matched - close spellings work\n• Reviews are optional but encouraged\n• You can update ratings anytime",
-            inline=False,
-        )
+        for name, value in _RATE_HELP_FIELDS:
+            embed.add_field(name=name, value=value, inline=False)
 
         await ctx.send(embed=embed)
 
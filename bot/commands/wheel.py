@@ -27,7 +27,7 @@ class WheelCommands(commands.Cog):
 
             # Select random genre and create animation
             selected_genre = self.wheel_service.spin_wheel()
-            gif_data = self.wheel_service.create_wheel_gif(selected_genre)
+            gif_data = await self.wheel_service.create_wheel_gif_async(selected_genre)
 
             # Send the spinning GIF
             gif_file = discord.File(fp=gif_data, filename="wheel_spinning.gif")
@@ -42,19 +42,17 @@ class WheelCommands(commands.Cog):
 
             # Create and send the final static wheel image
             final_angle = self.wheel_service._calculate_final_angle(selected_genre)
-            final_wheel_image = self.wheel_service.create_wheel_image(final_angle)
-
-            with io.BytesIO() as image_buffer:
-                final_wheel_image.save(image_buffer, "PNG")
-                image_buffer.seek(0)
+            final_wheel_png = await self.wheel_service.create_wheel_png_async(
+                final_angle
+            )
 
-                final_image_file = discord.File(
-                    fp=image_buffer, filename="final_wheel.png"
-                )
+            final_image_file = discord.File(
+                fp=io.BytesIO(final_wheel_png), filename="final_wheel.png"
+            )
 
-                # Delete the GIF and replace with static image
-                await gif_msg.delete()
-                await ctx.send(file=final_image_file)
+            # Delete the GIF and replace with static image
+            await gif_msg.delete()
+            await ctx.send(file=final_image_file)
 
             # Send the result message
             await initial_msg.edit(
@@ -104,17 +102,13 @@ class WheelCommands(commands.Cog):
 
         # Create and send wheel image
         try:
-            wheel_image = self.wheel_service.create_wheel_image()
+            wheel_png = self.wheel_service.get_static_wheel_png()
 
-            with io.BytesIO() as image_buffer:
-                wheel_image.save(image_buffer, "PNG")
-                image_buffer.seek(0)
-
-                image_file = discord.File(fp=image_buffer, filename="wheel.png")
-                await ctx.send(
-                    f"**Movie Genres on the Wheel ({len(genres)} total)**:\n{genres_text}",
-                    file=image_file,
-                )
+            image_file = discord.File(fp=io.BytesIO(wheel_png), filename="wheel.png")
+            await ctx.send(
+                f"**Movie Genres on the Wheel ({len(genres)} total)**:\n{genres_text}",
+                file=image_file,
+            )
         except Exception as e:
             # Fallback to text-only if image generation fails
             logger.error(f"Error generating wheel image: {e}")
@@ -0,0 +1,60 @@
+"""
+Database migration to index rotation skips by user and period end date
+Run this script to update your existing database
+"""
+
+import asyncio
+import logging
+from sqlalchemy import create_engine, text
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+async def migrate_database():
+    """Add the (user, end date, start date) index to rotation_skips"""
+
+    # Get database URL
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    # Handle Heroku postgres:// URLs
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+
+    engine = create_engine(database_url)
+
+    try:
+        with engine.connect() as conn:
+            create_index_sql = text(
+                """
+                CREATE INDEX IF NOT EXISTS ix_rotskip_user_end_start
+                ON rotation_skips (skipped_user_id, original_end_date, original_start_date)
+            """
+            )
+
+            conn.execute(create_index_sql)
+            conn.commit()
+
+            logger.info("Successfully added index 'ix_rotskip_user_end_start'")
+
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        raise
+    finally:
+        engine.dispose()
+
+
+def main():
+    """Run the migration"""
+    asyncio.run(migrate_database())
+
+
+if __name__ == "__main__":
+    main()
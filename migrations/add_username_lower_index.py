@@ -0,0 +1,81 @@
+"""
+Database migration to add a case-insensitive unique index on usernames
+Run this script to update your existing database
+"""
+
+import asyncio
+import logging
+from sqlalchemy import create_engine, text
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+async def migrate_database():
+    """Add unique index on lower(discord_username) to users table"""
+
+    # Get database URL
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    # Handle Heroku postgres:// URLs
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+
+    engine = create_engine(database_url)
+
+    try:
+        with engine.connect() as conn:
+            # Usernames that only differ by case would violate the index
+            check_duplicates_sql = text(
+                """
+                SELECT LOWER(discord_username), COUNT(*)
+                FROM users
+                GROUP BY LOWER(discord_username)
+                HAVING COUNT(*) > 1
+            """
+            )
+
+            duplicates = conn.execute(check_duplicates_sql).fetchall()
+
+            if duplicates:
+                logger.error("Found usernames that differ only by case:")
+                for dup in duplicates:
+                    logger.error(f"'{dup[0]}' is used by {dup[1]} users")
+                logger.error(
+                    "Merge or rename these users, then run this migration again"
+                )
+                return
+
+            create_index_sql = text(
+                """
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_user_lower_username
+                ON users (LOWER(discord_username))
+            """
+            )
+
+            conn.execute(create_index_sql)
+            conn.commit()
+
+            logger.info("Successfully added index 'uq_user_lower_username'")
+
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        raise
+    finally:
+        engine.dispose()
+
+
+def main():
+    """Run the migration"""
+    asyncio.run(migrate_database())
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     UniqueConstraint,
+    Index,
     CheckConstraint,
     JSON,
     Float,
@@ -19,6 +20,7 @@ from sqlalchemy import (
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.sql import func
+from contextlib import contextmanager
 from datetime import datetime
 import os
 import logging
@@ -43,6 +45,11 @@ class User(Base):
     movie_picks = relationship("MoviePick", back_populates="picker")
     ratings_given = relationship("MovieRating", back_populates="rater")
 
+    # Usernames are matched case-insensitively
+    __table_args__ = (
+        Index("uq_user_lower_username", func.lower(discord_username), unique=True),
+    )
+
     def __repr__(self):
         return (
             f"<User(username='{self.discord_username}', real_name='{self.real_name}')>"
@@ -168,6 +175,15 @@ class RotationSkip(Base):
             "original_end_date",
             name="unique_user_period_skip",
         ),
+        # Serves !undo_skip's lookup of a user's upcoming skipped periods
+        Index(
+            "ix_rotskip_user_end_start",
+            "skipped_user_id",
+            "original_end_date",
+            "original_start_date",
+        ),
+        # Serves !list_skips' most-recent-first listing
+        Index("ix_rotskip_start", "original_start_date"),
     )
 
     def __repr__(self):
@@ -199,6 +215,19 @@ class DatabaseManager:
         """Get a new database session"""
         return self.SessionLocal()
 
+    @contextmanager
+    def session_scope(self):
+        """Session that commits on success, rolls back on error and closes"""
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def init_rotation_state(self):
         """Initialize rotation state if it doesn't exist"""
         session = self.get_session()
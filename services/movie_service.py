@@ -6,11 +6,16 @@ import asyncio
 from functools import partial
 from typing import Optional, Tuple, Dict, Any
 import logging
+import time
 import aiohttp
 import os
 
 logger = logging.getLogger(__name__)
 
+# How many successful searches are kept, and for how long (seconds)
+_SEARCH_CACHE_MAX = 512
+_SEARCH_CACHE_TTL = 3600.0
+
 
 class MovieService:
     """Service for movie search and IMDB integration"""
@@ -18,11 +23,48 @@ class MovieService:
     def __init__(self, settings):
         self.settings = settings
         self.omdb_api_key = os.environ.get('OMDB_API_KEY')
+        # (title, year) -> (expires_at, movie_details) for successful searches
+        self._search_cache = {}
+        # (title, year) -> task for searches waiting on OMDb
+        self._searches_in_flight = {}
 
     async def search_movie(
         self, query: str, year: Optional[int] = None
     ) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """Search for a movie using OMDb API"""
+        """Search for a movie using OMDb API
+
+        Successful results are cached for an hour, keyed on the title
+        (ignoring case) and year, and concurrent searches for the same
+        movie share one request.
+        """
+        key = (query.replace('\\', '').strip().casefold(), year)
+
+        cached = self._search_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return (True, "Success", cached[1])
+
+        search = self._searches_in_flight.get(key)
+        if search is not None:
+            return await asyncio.shield(search)
+
+        search = asyncio.ensure_future(self._fetch_movie(query, year))
+        self._searches_in_flight[key] = search
+        try:
+            result = await asyncio.shield(search)
+        finally:
+            del self._searches_in_flight[key]
+
+        if result[0]:
+            self._search_cache.pop(key, None)
+            if len(self._search_cache) >= _SEARCH_CACHE_MAX:
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[key] = (time.monotonic() + _SEARCH_CACHE_TTL, result[2])
+        return result
+
+    async def _fetch_movie(
+        self, query: str, year: Optional[int] = None
+    ) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Look a movie up on OMDb, without caching"""
 
         clean_query = query.replace('\\', '')
 
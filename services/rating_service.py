@@ -6,6 +6,8 @@ import discord
 from typing import List, Optional
 import logging
 
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 from models.database import DatabaseManager, User, MoviePick, MovieRating
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,11 @@ class RatingService:
 
         session = self.db.get_session()
         try:
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 raise ValueError(f"User {username} not found")
 
@@ -98,8 +104,6 @@ class RatingService:
         """Get all ratings for a specific movie"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
             return (
                 session.query(MovieRating)
                 .options(
@@ -115,17 +119,24 @@ class RatingService:
         finally:
             session.close()
 
-    async def get_user_ratings(self, username: str) -> List[MovieRating]:
-        """Get all ratings by a specific user"""
+    async def get_user_ratings(
+        self, username: str, limit: Optional[int] = None
+    ) -> List[MovieRating]:
+        """Get a user's ratings, newest first, with rater and movie_pick.picker loaded
+
+        Pass limit to fetch only the most recent ones instead of the full history.
+        """
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 return []
 
-            return (
+            query = (
                 session.query(MovieRating)
                 .options(
                     joinedload(MovieRating.rater),  # Eagerly load rater
@@ -135,17 +146,18 @@ class RatingService:
                 )
                 .filter(MovieRating.rater_user_id == user.id)
                 .order_by(MovieRating.rated_at.desc())
-                .all()
             )
+            if limit is not None:
+                query = query.limit(limit)
+
+            return query.all()
         finally:
             session.close()
 
     async def get_recent_ratings(self, limit: int = 10) -> List[MovieRating]:
-        """Get most recent ratings from all users"""
+        """Get most recent ratings from all users, with rater and movie_pick.picker loaded"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
             return (
                 session.query(MovieRating)
                 .options(
@@ -162,12 +174,9 @@ class RatingService:
             session.close()
 
     async def get_top_rated_movies(self, limit: int = 10) -> List[MoviePick]:
-        """Get top rated movies by average rating"""
+        """Get top rated movies by average rating, with picker and ratings loaded"""
         session = self.db.get_session()
         try:
-            from sqlalchemy import func
-            from sqlalchemy.orm import joinedload
-
             # Query movies with their average ratings
             subquery = (
                 session.query(
@@ -209,12 +218,14 @@ class RatingService:
         """Get rating statistics for a user"""
         session = self.db.get_session()
         try:
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 return {}
 
-            from sqlalchemy import func
-
             stats = (
                 session.query(
                     func.count(MovieRating.id).label("total_ratings"),
@@ -239,8 +250,6 @@ class RatingService:
         """Create Discord embed showing all ratings for a movie by title"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
             # Find movie by title with eager loading
             movie_pick = (
                 session.query(MoviePick)
@@ -301,7 +310,11 @@ class RatingService:
         """Create Discord embed showing user rating statistics"""
         session = self.db.get_session()
         try:
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 raise ValueError("User not found")
 
@@ -339,7 +352,11 @@ class RatingService:
         """Delete a user's rating for a movie by title"""
         session = self.db.get_session()
         try:
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 return False
 
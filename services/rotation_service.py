@@ -6,7 +6,16 @@ import discord
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple, Any
-from models.database import DatabaseManager, User, MoviePick, MovieRating, RotationState
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+from models.database import (
+    DatabaseManager,
+    User,
+    MoviePick,
+    MovieRating,
+    RotationState,
+    RotationSkip,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +26,14 @@ class RotationService:
     def __init__(self, settings):
         self.settings = settings
         self.db = DatabaseManager(settings.database_url_corrected)
+        # Bumped whenever rotation skips (or the users they name) change, so
+        # callers can tell whether skip listings they've built are stale
+        self.skips_version = 0
+        # Bumped whenever movie picks are added, changed or deleted
+        self.picks_version = 0
+        # Bumped whenever the rotation order or start date changes, which
+        # can change who the current picker is
+        self.rotation_version = 0
 
     async def initialize_database(self):
         """Initialize database tables and state"""
@@ -28,8 +45,19 @@ class RotationService:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
-    async def setup_rotation(self, user_data: List[Tuple[str, str]]):
-        """Set up the rotation with user data"""
+    async def setup_rotation(
+        self,
+        user_data: List[Tuple[str, str]],
+        start_date: Optional[datetime] = None,
+    ):
+        """
+        Set up the rotation with user data
+
+        Args:
+            user_data: List of (discord_username, real_name) in rotation order
+            start_date: Optional rotation start date, saved in the same
+                transaction as the users
+        """
         session = self.db.get_session()
         try:
             # Clear existing users
@@ -44,7 +72,13 @@ class RotationService:
                 )
                 session.add(user)
 
+            if start_date is not None:
+                session.flush()
+                self._set_rotation_start_date(session, start_date)
+
             session.commit()
+            self.skips_version += 1
+            self.rotation_version += 1
             logger.info(f"Set up rotation with {len(user_data)} users")
 
         except Exception as e:
@@ -58,21 +92,9 @@ class RotationService:
         """Update the rotation start date"""
         session = self.db.get_session()
         try:
-            # Get users ordered by rotation position
-            users = session.query(User).order_by(User.rotation_position).all()
-            if not users:
-                raise ValueError("No users in rotation")
-
-            # Update rotation state
-            rotation_state = session.query(RotationState).first()
-            if not rotation_state:
-                rotation_state = RotationState(id=1)
-                session.add(rotation_state)
-
-            rotation_state.rotation_start_date = start_date
-            rotation_state.current_user_id = users[0].id
-
+            self._set_rotation_start_date(session, start_date)
             session.commit()
+            self.rotation_version += 1
             logger.info(f"Updated rotation start date to {start_date}")
 
         except Exception as e:
@@ -82,6 +104,22 @@ class RotationService:
         finally:
             session.close()
 
+    def _set_rotation_start_date(self, session, start_date: datetime):
+        """Point the rotation state at the first user from the given start date"""
+        # Get the first user by rotation position
+        first_user = session.query(User).order_by(User.rotation_position).first()
+        if not first_user:
+            raise ValueError("No users in rotation")
+
+        # Update rotation state
+        rotation_state = session.query(RotationState).first()
+        if not rotation_state:
+            rotation_state = RotationState(id=1)
+            session.add(rotation_state)
+
+        rotation_state.rotation_start_date = start_date
+        rotation_state.current_user_id = first_user.id
+
     async def skip_picker(
         self, skipped_by: str, who: str, reason: str = None
     ) -> tuple[bool, str, dict]:
@@ -98,8 +136,6 @@ class RotationService:
         """
         session = self.db.get_session()
         try:
-            from models.database import RotationSkip
-
             # Get current and next pickers
             current_user, current_start, current_end = await self.get_current_picker()
             users = session.query(User).order_by(User.rotation_position).all()
@@ -186,6 +222,7 @@ class RotationService:
 
             session.add(skip_record)
             session.commit()
+            self.skips_version += 1
 
             # Store the skip period info before closing session
             skip_period_str = (
@@ -255,8 +292,6 @@ class RotationService:
         """Get all skips that affect periods before the given date range"""
         session = self.db.get_session()
         try:
-            from models.database import RotationSkip
-
             skips = (
                 session.query(RotationSkip)
                 .filter(RotationSkip.original_start_date <= end_date.date())
@@ -273,8 +308,6 @@ class RotationService:
         """Count how many skips have occurred that affect the rotation up to this point"""
         session = self.db.get_session()
         try:
-            from models.database import RotationSkip
-
             rotation_state = session.query(RotationState).first()
             if not rotation_state or not rotation_state.rotation_start_date:
                 return 0
@@ -314,8 +347,6 @@ class RotationService:
         """Get current picker information, accounting for skips"""
         session = self.db.get_session()
         try:
-            from models.database import RotationSkip
-
             rotation_state = session.query(RotationState).first()
             if not rotation_state or not rotation_state.rotation_start_date:
                 raise ValueError("No rotation state set up")
@@ -378,8 +409,6 @@ class RotationService:
         """Get next picker information, accounting for skips"""
         session = self.db.get_session()
         try:
-            from models.database import RotationSkip
-
             current_user, _, current_end = await self.get_current_picker()
             users = session.query(User).order_by(User.rotation_position).all()
 
@@ -425,7 +454,11 @@ class RotationService:
         """Check if user can pick a movie right now"""
         session = self.db.get_session()
         try:
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 return False, f"User {username} is not in the rotation"
 
@@ -491,13 +524,23 @@ class RotationService:
         movie_title: str,
         movie_year: int = None,
         pick_date: datetime = None,
-    ) -> MoviePick:
-        """Add a historical movie pick with custom date"""
+    ) -> Tuple[MoviePick, User]:
+        """
+        Add a historical movie pick with custom date
+
+        Returns:
+            Tuple of (movie_pick, picker) so callers don't need to look the
+            user up again
+        """
         session = self.db.get_session()
         try:
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
-                raise ValueError(f"User {username} not found")
+                raise ValueError(f"User @{username} not found in rotation")
 
             # Calculate period dates based on user's position and rotation start
             rotation_state = session.query(RotationState).first()
@@ -522,10 +565,12 @@ class RotationService:
 
             session.add(movie_pick)
             session.commit()
+            self.picks_version += 1
             session.refresh(movie_pick)
+            session.refresh(user)
 
             logger.info(f"Added historical pick: {movie_title} by {username}")
-            return movie_pick
+            return movie_pick, user
 
         except Exception as e:
             session.rollback()
@@ -538,8 +583,6 @@ class RotationService:
         """Get recent movie picks"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
             # Eagerly load relationships to avoid lazy loading issues
             picks = (
                 session.query(MoviePick)
@@ -562,9 +605,11 @@ class RotationService:
         """Get pick history for a specific user"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 return []
 
@@ -589,7 +634,11 @@ class RotationService:
         """Get user by Discord username"""
         session = self.db.get_session()
         try:
-            return session.query(User).filter(User.discord_username == username).first()
+            return (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
         finally:
             session.close()
 
@@ -602,8 +651,6 @@ class RotationService:
         """
         session = self.db.get_session()
         try:
-            from models.database import RotationSkip
-
             users = session.query(User).order_by(User.rotation_position).all()
             if not users:
                 return []
@@ -760,6 +807,7 @@ class RotationService:
             if movie_pick:
                 session.delete(movie_pick)
                 session.commit()
+                self.picks_version += 1
                 logger.info(f"Deleted movie pick ID {movie_id}")
                 return True
 
@@ -783,6 +831,9 @@ class RotationService:
             session.query(User).delete()
 
             session.commit()
+            self.skips_version += 1
+            self.picks_version += 1
+            self.rotation_version += 1
 
             # Re-initialize rotation state
             self.db.init_rotation_state()
@@ -800,21 +851,26 @@ class RotationService:
         """Get admin statistics"""
         session = self.db.get_session()
         try:
-            from sqlalchemy import func
-
-            # User stats
-            total_users = session.query(User).count()
-            active_users = (
-                session.query(User).filter(User.rotation_position.isnot(None)).count()
-            )
-
-            # Movie stats
-            total_picks = session.query(MoviePick).count()
-            rated_movies = session.query(MoviePick).join(MovieRating).distinct().count()
-
-            # Rating stats
-            total_ratings = session.query(MovieRating).count()
-            avg_rating_result = session.query(func.avg(MovieRating.rating)).scalar()
+            # User, movie and rating counts in a single round trip
+            (
+                total_users,
+                active_users,
+                total_picks,
+                rated_movies,
+                total_ratings,
+                avg_rating_result,
+            ) = session.query(
+                select(func.count(User.id)).scalar_subquery(),
+                select(func.count(User.id))
+                .where(User.rotation_position.isnot(None))
+                .scalar_subquery(),
+                select(func.count(MoviePick.id)).scalar_subquery(),
+                select(
+                    func.count(MovieRating.movie_pick_id.distinct())
+                ).scalar_subquery(),
+                select(func.count(MovieRating.id)).scalar_subquery(),
+                select(func.avg(MovieRating.rating)).scalar_subquery(),
+            ).one()
             average_rating = float(avg_rating_result) if avg_rating_result else 0.0
 
             # Current rotation info
@@ -824,7 +880,7 @@ class RotationService:
                 )
                 current_period = f"{current_user.real_name} ({current_start.strftime('%b %d')} - {current_end.strftime('%b %d')})"
                 days_remaining = (current_end - datetime.now()).days
-            except:
+            except Exception:
                 current_period = "Not set up"
                 days_remaining = 0
 
@@ -854,9 +910,11 @@ class RotationService:
         """Add or update a movie pick for the user's current/upcoming period"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 raise ValueError(f"User {username} not found")
 
@@ -897,6 +955,7 @@ class RotationService:
                 existing_pick.pick_date = datetime.now()
 
                 session.commit()
+                self.picks_version += 1
                 session.refresh(existing_pick)
 
                 logger.info(f"Updated movie pick: {movie_title} by {username}")
@@ -916,6 +975,7 @@ class RotationService:
 
                 session.add(movie_pick)
                 session.commit()
+                self.picks_version += 1
                 session.refresh(movie_pick)
 
                 logger.info(f"Added movie pick: {movie_title} by {username}")
@@ -932,8 +992,6 @@ class RotationService:
         """Get the movie pick for the current period"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
             # Get current period dates
             current_user, current_start, current_end = await self.get_current_picker()
 
@@ -961,9 +1019,11 @@ class RotationService:
         """Get user's active pick (current period or upcoming period if in early access)"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
-            user = session.query(User).filter(User.discord_username == username).first()
+            user = (
+                session.query(User)
+                .filter(func.lower(User.discord_username) == username.lower())
+                .first()
+            )
             if not user:
                 return None
 
@@ -1010,14 +1070,31 @@ class RotationService:
         finally:
             session.close()
 
+    async def get_user_period_pick(
+        self, user_id: int, period_start: datetime, period_end: datetime
+    ) -> Optional[MoviePick]:
+        """Get a user's pick for a period the caller has already resolved"""
+        session = self.db.get_session()
+        try:
+            return (
+                session.query(MoviePick)
+                .filter(
+                    MoviePick.picker_user_id == user_id,
+                    MoviePick.period_start_date == period_start.date(),
+                    MoviePick.period_end_date == period_end.date(),
+                )
+                .first()
+            )
+
+        finally:
+            session.close()
+
     async def get_picks_for_period(
         self, period_start: datetime, period_end: datetime
     ) -> List[MoviePick]:
         """Get all picks for a specific period"""
         session = self.db.get_session()
         try:
-            from sqlalchemy.orm import joinedload
-
             picks = (
                 session.query(MoviePick)
                 .options(
@@ -1051,12 +1128,10 @@ class RotationService:
         """
         session = self.db.get_session()
         try:
-            from sqlalchemy import func
-
             # Check if user already exists
             existing_user = (
                 session.query(User)
-                .filter(User.discord_username == discord_username)
+                .filter(func.lower(User.discord_username) == discord_username.lower())
                 .first()
             )
 
@@ -1096,6 +1171,7 @@ class RotationService:
 
             session.add(new_user)
             session.commit()
+            self.rotation_version += 1
 
             # Get total users for context
             total_users = session.query(User).count()
@@ -1157,7 +1233,7 @@ class RotationService:
             # Find the user
             user_to_remove = (
                 session.query(User)
-                .filter(User.discord_username == discord_username)
+                .filter(func.lower(User.discord_username) == discord_username.lower())
                 .first()
             )
 
@@ -1182,8 +1258,6 @@ class RotationService:
             )
 
             # Check if they're currently scheduled or have future picks
-            from models.database import RotationSkip
-
             # Get current and next picker to check if they're active
             try:
                 current_user, current_start, current_end = (
@@ -1193,7 +1267,7 @@ class RotationService:
 
                 next_user, next_start, next_end = await self.get_next_picker()
                 is_next = next_user.id == removed_id if next_user else False
-            except:
+            except Exception:
                 is_current = False
                 is_next = False
 
@@ -1226,6 +1300,8 @@ class RotationService:
                 user.rotation_position -= 1
 
             session.commit()
+            self.skips_version += 1
+            self.rotation_version += 1
 
             # Get new total of active users
             active_users = (
@@ -1292,7 +1368,7 @@ class RotationService:
             user_to_reactivate = (
                 session.query(User)
                 .filter(
-                    User.discord_username == discord_username,
+                    func.lower(User.discord_username) == discord_username.lower(),
                     User.rotation_position.is_(None),  # Only inactive users
                 )
                 .first()
@@ -1303,7 +1379,7 @@ class RotationService:
                 active_user = (
                     session.query(User)
                     .filter(
-                        User.discord_username == discord_username,
+                        func.lower(User.discord_username) == discord_username.lower(),
                         User.rotation_position.isnot(None),
                     )
                     .first()
@@ -1346,6 +1422,7 @@ class RotationService:
             # Reactivate the user
             user_to_reactivate.rotation_position = new_position
             session.commit()
+            self.rotation_version += 1
 
             # Get stats
             pick_count = (
@@ -1397,31 +1474,34 @@ class RotationService:
             inactive_users = (
                 session.query(User).filter(User.rotation_position.is_(None)).all()
             )
+            if not inactive_users:
+                return []
 
-            result = []
-            for user in inactive_users:
-                pick_count = (
-                    session.query(MoviePick)
-                    .filter(MoviePick.picker_user_id == user.id)
-                    .count()
-                )
-
-                rating_count = (
-                    session.query(MovieRating)
-                    .filter(MovieRating.rater_user_id == user.id)
-                    .count()
-                )
-
-                result.append(
-                    {
-                        "username": user.discord_username,
-                        "real_name": user.real_name,
-                        "picks": pick_count,
-                        "ratings": rating_count,
-                    }
-                )
+            # Pick and rating counts for all inactive users in two grouped
+            # queries rather than two per user
+            user_ids = [user.id for user in inactive_users]
+            pick_counts = dict(
+                session.query(MoviePick.picker_user_id, func.count(MoviePick.id))
+                .filter(MoviePick.picker_user_id.in_(user_ids))
+                .group_by(MoviePick.picker_user_id)
+                .all()
+            )
+            rating_counts = dict(
+                session.query(MovieRating.rater_user_id, func.count(MovieRating.id))
+                .filter(MovieRating.rater_user_id.in_(user_ids))
+                .group_by(MovieRating.rater_user_id)
+                .all()
+            )
 
-            return result
+            return [
+                {
+                    "username": user.discord_username,
+                    "real_name": user.real_name,
+                    "picks": pick_counts.get(user.id, 0),
+                    "ratings": rating_counts.get(user.id, 0),
+                }
+                for user in inactive_users
+            ]
 
         finally:
             session.close()
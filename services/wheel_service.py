@@ -1,18 +1,34 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import math
 import secrets
-from typing import Final
+import tempfile
+import threading
+from typing import IO, TYPE_CHECKING, Final, NamedTuple
 
-import imageio
-from PIL import Image, ImageDraw, ImageFont
+# NumPy and Pillow are imported where they are used, so the bot does not
+# pay for loading them until the wheel is first drawn
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFont
 
 # Type aliases for better readability
 Color = tuple[int, int, int]
 Position = tuple[int, int]
 
 
+class _RenderSnapshot(NamedTuple):
+    """Genre-derived drawing data captured together under the render lock."""
+
+    genres: tuple[str, ...]
+    labels: list[str]
+    text_cos: np.ndarray
+    text_sin: np.ndarray
+    version: int
+
+
 class WheelService:
     """A movie genre wheel that creates spinning animations and manages genres."""
 
@@ -67,23 +83,98 @@ class WheelService:
         (128, 128, 64),
     ]
 
+    # Every color the wheel is drawn with: the segments, black text and
+    # borders, the red pointer, the gray center circle and white background
+    PALETTE_COLORS: Final[list[Color]] = WHEEL_COLORS + [
+        (0, 0, 0),
+        (255, 0, 0),
+        (100, 100, 100),
+        (255, 255, 255),
+    ]
+    WHITE_INDEX: Final[int] = len(PALETTE_COLORS) - 1
+
+    # The same colors as a 256 entry palette for palette mode images
+    GIF_PALETTE: Final[bytes] = bytes(
+        channel for color in PALETTE_COLORS for channel in color
+    ).ljust(768, b"\0")
+
     # Image settings
     IMAGE_SIZE: Final[int] = 500
     RADIUS_OFFSET: Final[int] = 20
     TEXT_RADIUS_RATIO: Final[float] = 0.7
+    MIN_LABEL_ARC_RATIO: Final[float] = 0.8
     CENTER_CIRCLE_RADIUS: Final[int] = 20
     POINTER_LENGTH: Final[int] = 30
     POINTER_WIDTH: Final[int] = 15
 
     # Animation settings
+    ANIMATION_SIZE: Final[int] = 250
     ANIMATION_FRAMES: Final[int] = 30
     FULL_ROTATIONS: Final[int] = 3
     GIF_DURATION: Final[float] = 0.07
+    GIF_TRANSPARENT_INDEX: Final[int] = 255
+    GIF_SPOOL_MAX_SIZE: Final[int] = 1024 * 1024
 
     def __init__(self, settings) -> None:
         """Initialize the wheel with default genres."""
         self.settings = settings
         self.genres = self.DEFAULT_GENRES.copy()
+        self._genre_set = set(self.genres)
+
+        # PNG of the wheel at rest, reused until the genres change
+        self._static_png_cache: bytes | None = None
+
+        # Palette mode wheel rotated for every GIF frame, also reused until
+        # the genres change
+        self._indexed_wheel_cache: Image.Image | None = None
+
+        # Drawing resources are loaded on the first render
+        self._render_resources_loaded = False
+
+        # Renders run in an executor thread while the event loop edits the
+        # genres: the lock covers genre edits, loading the resources and
+        # taking render snapshots, and the version tells a finished render
+        # whether its genres are stale
+        self._render_lock = threading.Lock()
+        self._genres_version = 0
+
+    def _ensure_render_resources(self) -> None:
+        """Load the fonts, palettes and pixel grids used to draw the wheel."""
+        if self._render_resources_loaded:
+            return
+
+        with self._render_lock:
+            if not self._render_resources_loaded:
+                self._load_render_resources()
+
+    def _load_render_resources(self) -> None:
+        """Build the drawing resources; called with the render lock held."""
+        import numpy as np
+        from PIL import Image
+
+        # Drawing resources that never change between renders
+        self._font = self._get_font()
+        left, top, right, bottom = self._font.getbbox("Ag")
+        self._font_height = bottom - top
+        self._palette_np = np.array(self.PALETTE_COLORS, dtype=np.uint8)
+        self._palette_image = Image.new("P", (1, 1))
+        self._palette_image.putpalette(self.GIF_PALETTE)
+
+        # Polar coordinate grid of the canvas, used to paint the segments
+        # in a single vectorized pass instead of one pieslice per genre
+        (cx, cy), radius = self._get_center_and_radius()
+        yy, xx = np.ogrid[: self.IMAGE_SIZE, : self.IMAGE_SIZE]
+        self._angles = np.degrees(np.arctan2(yy - cy, xx - cx)) % 360
+        self._radius_mask = (xx - cx) ** 2 + (yy - cy) ** 2 <= radius**2
+
+        self._rebuild_trig_cache()
+        self._rebuild_labels()
+
+        # Static pointer pasted over every GIF frame
+        self._pointer_overlay = self._render_pointer_overlay_indexed()
+        self._pointer_mask = self._pointer_overlay != self.GIF_TRANSPARENT_INDEX
+
+        self._render_resources_loaded = True
 
     def spin_wheel(self) -> str:
         """
@@ -99,7 +190,15 @@ class WheelService:
         """
         if not self.genres:
             raise ValueError("No genres available to spin")
-        return secrets.choice(self.genres)
+
+        # Rejection sampling over the smallest power of two covering every
+        # genre keeps the pick uniform without any modulo bias
+        genre_count = len(self.genres)
+        bits = (genre_count - 1).bit_length()
+        while True:
+            index = secrets.randbits(bits)
+            if index < genre_count:
+                return self.genres[index]
 
     def add_genre(self, genre: str) -> bool:
         """
@@ -115,10 +214,14 @@ class WheelService:
         if not genre:
             return False
 
-        if genre not in self.genres:
+        if genre in self._genre_set:
+            return False
+
+        with self._render_lock:
+            self._genre_set.add(genre)
             self.genres.append(genre)
-            return True
-        return False
+            self._invalidate_caches()
+        return True
 
     def remove_genre(self, genre: str) -> bool:
         """
@@ -130,12 +233,16 @@ class WheelService:
         Returns:
             bool: True if genre was removed, False if it wasn't found
         """
-        try:
-            self.genres.remove(genre.strip())
-            return True
-        except ValueError:
+        genre = genre.strip()
+        if genre not in self._genre_set:
             return False
 
+        with self._render_lock:
+            self._genre_set.remove(genre)
+            self.genres.remove(genre)
+            self._invalidate_caches()
+        return True
+
     @property
     def genre_list(self) -> list[str]:
         """Get a copy of the current genres list."""
@@ -154,65 +261,144 @@ class WheelService:
 
     def _get_font(self) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         """Load a font, falling back to default if Arial is not available."""
+        from PIL import ImageFont
+
         try:
             return ImageFont.truetype("arial.ttf", 14)
         except (OSError, IOError):
             return ImageFont.load_default()
 
-    def _calculate_text_position(
-        self, center: Position, radius: int, angle: float
-    ) -> Position:
-        """Calculate the position for text at a given angle."""
-        text_radius = radius * self.TEXT_RADIUS_RATIO
-        text_angle_rad = math.radians(angle)
+    def _invalidate_caches(self) -> None:
+        """Refresh everything derived from the genres; needs the render lock."""
+        self._genres_version += 1
+        self._static_png_cache = None
+        self._indexed_wheel_cache = None
 
-        x = center[0] + int(text_radius * math.cos(text_angle_rad))
-        y = center[1] + int(text_radius * math.sin(text_angle_rad))
+        if self._render_resources_loaded:
+            self._rebuild_trig_cache()
+            self._rebuild_labels()
 
-        return (x, y)
+    def _snapshot(self) -> _RenderSnapshot:
+        """Capture the genres and everything drawn from them in one piece.
+
+        Renders draw only from the snapshot, so a genre edited on the event
+        loop mid-render can't pair labels with another wheel's angles.
+        """
+        self._ensure_render_resources()
+        with self._render_lock:
+            return _RenderSnapshot(
+                tuple(self.genres),
+                self._labels,
+                self._text_cos,
+                self._text_sin,
+                self._genres_version,
+            )
+
+    def _rebuild_trig_cache(self) -> None:
+        """Precompute the direction of each segment's label at angle 0."""
+        import numpy as np
+
+        segment_count = len(self.genres)
+        base_angles = (np.arange(segment_count) + 0.5) * (360 / max(segment_count, 1))
+        self._text_cos = np.cos(np.radians(base_angles))
+        self._text_sin = np.sin(np.radians(base_angles))
+
+    def _rebuild_labels(self) -> None:
+        """Pick the label of each segment, numbering segments too narrow to read."""
+        segment_count = len(self.genres)
+        _, radius = self._get_center_and_radius()
+        arc_length = (
+            2 * math.pi * radius * self.TEXT_RADIUS_RATIO / max(segment_count, 1)
+        )
+
+        if arc_length < self._font_height * self.MIN_LABEL_ARC_RATIO:
+            self._labels = [str(i + 1) for i in range(segment_count)]
+        else:
+            self._labels = list(self.genres)
+
+    def _render_segment_indices(
+        self, snapshot: _RenderSnapshot, rotation_angle: float = 0
+    ) -> np.ndarray:
+        """Map every pixel of the canvas to its index in the wheel palette."""
+        import numpy as np
+
+        indices = np.full(
+            (self.IMAGE_SIZE, self.IMAGE_SIZE), self.WHITE_INDEX, dtype=np.uint8
+        )
+        if not snapshot.genres:
+            return indices
+
+        segment_count = len(snapshot.genres)
+        angle_per_segment = 360 / segment_count
+
+        # Segment index of every pixel (angles grow clockwise, like pieslice)
+        idx = (((self._angles - rotation_angle) % 360) / angle_per_segment).astype(
+            np.int32
+        )
+        np.minimum(idx, segment_count - 1, out=idx)
+
+        indices[self._radius_mask] = idx[self._radius_mask] % len(self.WHEEL_COLORS)
+        return indices
+
+    def _render_segments(
+        self, snapshot: _RenderSnapshot, rotation_angle: float = 0
+    ) -> Image.Image:
+        """Paint the colored wheel segments onto a white canvas."""
+        import numpy as np
+        from PIL import Image
+
+        indices = self._render_segment_indices(snapshot, rotation_angle)
+
+        # Each render gets its own pixels: GIFs are built in an executor
+        # thread while the event loop may be rendering a still image
+        return Image.fromarray(np.take(self._palette_np, indices, axis=0))
 
     def _draw_wheel_segments(
         self,
         draw: ImageDraw.ImageDraw,
+        snapshot: _RenderSnapshot,
         center: Position,
         radius: int,
         rotation_angle: float = 0,
     ) -> None:
-        """Draw all segments of the wheel with genres and colors."""
-        if not self.genres:
+        """Draw the genre labels on top of the painted segments."""
+        if not snapshot.genres:
             return
 
-        angle_per_segment = 360 / len(self.genres)
-        font = self._get_font()
-
-        for i, genre in enumerate(self.genres):
-            # Calculate segment angles
-            start_angle = rotation_angle + i * angle_per_segment
-            end_angle = start_angle + angle_per_segment
-
-            # Draw the segment
-            segment_color = self.WHEEL_COLORS[i % len(self.WHEEL_COLORS)]
-            draw.pieslice(
-                [
-                    (center[0] - radius, center[1] - radius),
-                    (center[0] + radius, center[1] + radius),
-                ],
-                start_angle,
-                end_angle,
-                fill=segment_color,
-            )
+        # Rotate the cached label directions instead of N cos/sin calls
+        rotation_rad = math.radians(rotation_angle)
+        cos_r, sin_r = math.cos(rotation_rad), math.sin(rotation_rad)
+        text_radius = radius * self.TEXT_RADIUS_RATIO
 
-            # Calculate text position
-            text_angle = start_angle + angle_per_segment / 2
-            text_pos = self._calculate_text_position(center, radius, text_angle)
+        text_cos, text_sin = snapshot.text_cos, snapshot.text_sin
+        xs = center[0] + (text_radius * (cos_r * text_cos - sin_r * text_sin)).astype(
+            int
+        )
+        ys = center[1] + (text_radius * (sin_r * text_cos + cos_r * text_sin)).astype(
+            int
+        )
 
-            # Draw the genre name
-            draw.text(text_pos, genre, fill=(0, 0, 0), font=font, anchor="mm")
+        for label, x, y in zip(snapshot.labels, xs.tolist(), ys.tolist()):
+            # Draw the label at the middle of its segment
+            draw.text((x, y), label, fill=(0, 0, 0), font=self._font, anchor="mm")
+
+    def _draw_wheel_border(
+        self, draw: ImageDraw.ImageDraw, center: Position, radius: int
+    ) -> None:
+        """Draw the outer border of the wheel."""
+        draw.ellipse(
+            [
+                (center[0] - radius, center[1] - radius),
+                (center[0] + radius, center[1] + radius),
+            ],
+            outline=(0, 0, 0),
+            width=2,
+        )
 
     def _draw_wheel_decorations(
         self, draw: ImageDraw.ImageDraw, center: Position, radius: int
     ) -> None:
-        """Draw the center circle, border, and pointer."""
+        """Draw the center circle and pointer."""
         # Draw center circle
         draw.ellipse(
             [
@@ -228,16 +414,6 @@ class WheelService:
             fill=(100, 100, 100),
         )
 
-        # Draw outer border
-        draw.ellipse(
-            [
-                (center[0] - radius, center[1] - radius),
-                (center[0] + radius, center[1] + radius),
-            ],
-            outline=(0, 0, 0),
-            width=2,
-        )
-
         # Draw pointer at the top - flipped so the point touches the wheel
         pointer_tip = (center[0], center[1] - radius + 5)  # Point touches the wheel
         pointer_left = (
@@ -256,6 +432,73 @@ class WheelService:
             width=2,
         )
 
+    def _render_base_wheel(self, snapshot: _RenderSnapshot) -> Image.Image:
+        """Render the wheel at angle 0 with segments, labels and border."""
+        from PIL import ImageDraw
+
+        image = self._render_segments(snapshot)
+        draw = ImageDraw.Draw(image)
+
+        center, radius = self._get_center_and_radius()
+
+        self._draw_wheel_segments(draw, snapshot, center, radius)
+        self._draw_wheel_border(draw, center, radius)
+
+        return image
+
+    def _to_animation_palette(self, image: Image.Image) -> Image.Image:
+        """Scale a full size render down to the animation size on the GIF palette."""
+        from PIL import Image
+
+        animation_size = (self.ANIMATION_SIZE, self.ANIMATION_SIZE)
+        return (
+            image.convert("RGB")
+            .resize(animation_size, Image.LANCZOS)
+            .quantize(palette=self._palette_image, dither=Image.Dither.NONE)
+        )
+
+    def _render_base_wheel_indexed(self, snapshot: _RenderSnapshot) -> Image.Image:
+        """Render the wheel at angle 0 as a mode 'P' animation frame."""
+        return self._to_animation_palette(self._render_base_wheel(snapshot))
+
+    def _render_pointer_overlay(self) -> Image.Image:
+        """Render the static center circle and pointer on a transparent layer."""
+        from PIL import Image, ImageDraw
+
+        overlay = Image.new("RGBA", (self.IMAGE_SIZE, self.IMAGE_SIZE), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+
+        center, radius = self._get_center_and_radius()
+        self._draw_wheel_decorations(draw, center, radius)
+
+        return overlay
+
+    def _render_pointer_overlay_indexed(self) -> np.ndarray:
+        """Render the center circle and pointer as animation palette indices."""
+        import numpy as np
+        from PIL import Image
+
+        overlay = self._render_pointer_overlay()
+        indices = np.array(self._to_animation_palette(overlay))
+
+        # Pixels that end up mostly transparent after scaling are left out
+        alpha = overlay.getchannel("A").resize(indices.shape[::-1], Image.LANCZOS)
+        indices[np.asarray(alpha) < 128] = self.GIF_TRANSPARENT_INDEX
+        return indices
+
+    def _compose_frame(
+        self, base: Image.Image, pointer_overlay: Image.Image, rotation_angle: float
+    ) -> Image.Image:
+        """Rotate the base wheel and paste the static pointer on top."""
+        from PIL import Image
+
+        # PIL rotates counter-clockwise while wheel angles grow clockwise
+        frame = base.rotate(
+            -rotation_angle, resample=Image.BILINEAR, fillcolor=(255, 255, 255)
+        ).convert("RGB")
+        frame.paste(pointer_overlay, (0, 0), pointer_overlay)
+        return frame
+
     def create_wheel_image(self, rotation_angle: float = 0) -> Image.Image:
         """
         Create a wheel image at a specific rotation angle.
@@ -266,25 +509,67 @@ class WheelService:
         Returns:
             PIL Image of the wheel
         """
-        # Create image with white background
-        image = Image.new("RGB", (self.IMAGE_SIZE, self.IMAGE_SIZE), (255, 255, 255))
-        draw = ImageDraw.Draw(image)
+        return self._compose_frame(
+            self._render_base_wheel(self._snapshot()),
+            self._render_pointer_overlay(),
+            rotation_angle,
+        )
 
-        center, radius = self._get_center_and_radius()
+    def get_static_wheel_png(self) -> bytes:
+        """
+        Get the wheel at rest as PNG bytes.
 
-        # Draw wheel components
-        self._draw_wheel_segments(draw, center, radius, rotation_angle)
-        self._draw_wheel_decorations(draw, center, radius)
+        The image is rendered once and cached until a genre is added or
+        removed.
 
-        return image
+        Returns:
+            bytes: PNG data of the wheel at rotation 0
+        """
+        if self._static_png_cache is None:
+            self._static_png_cache = self.create_wheel_png()
+        return self._static_png_cache
+
+    def create_wheel_png(self, rotation_angle: float = 0) -> bytes:
+        """
+        Create a wheel image at a specific rotation angle as PNG bytes.
+
+        Args:
+            rotation_angle: The rotation angle in degrees
+
+        Returns:
+            bytes: PNG data of the wheel
+        """
+        with io.BytesIO() as image_buffer:
+            self.create_wheel_image(rotation_angle).save(image_buffer, "PNG")
+            return image_buffer.getvalue()
+
+    async def create_wheel_png_async(self, rotation_angle: float = 0) -> bytes:
+        """
+        Create the wheel PNG without blocking the event loop.
+
+        Rendering and encoding run in the default executor; see
+        ``create_wheel_png`` for details.
+
+        Args:
+            rotation_angle: The rotation angle in degrees
 
-    def _calculate_final_angle(self, selected_genre: str) -> float:
+        Returns:
+            bytes: PNG data of the wheel
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.create_wheel_png, rotation_angle)
+
+    def _calculate_final_angle(
+        self, selected_genre: str, genres: tuple[str, ...] | None = None
+    ) -> float:
         """Calculate the final angle for the wheel to land on the selected genre."""
-        if selected_genre not in self.genres:
+        if genres is None:
+            genres = tuple(self.genres)
+        if selected_genre not in genres:
             raise ValueError(f"Genre '{selected_genre}' not found in wheel")
 
-        selected_index = self.genres.index(selected_genre)
-        angle_per_segment = 360 / len(self.genres)
+        selected_index = genres.index(selected_genre)
+        angle_per_segment = 360 / len(genres)
 
         # Calculate where the selected segment should be positioned
         # (under the top pointer at 270 degrees)
@@ -293,25 +578,20 @@ class WheelService:
         )
         return 270 - segment_center_angle
 
-    def _generate_rotation_angles(self, final_angle: float) -> list[float]:
-        """Generate a list of rotation angles for smooth animation."""
-        angles = []
-
-        for i in range(self.ANIMATION_FRAMES):
-            # Quadratic ease-out for realistic deceleration
-            progress = i / (self.ANIMATION_FRAMES - 1)
-            eased_progress = 1 - (1 - progress) ** 2
+    def _generate_rotation_angles(self, final_angle: float) -> np.ndarray:
+        """Generate the rotation angles for smooth animation."""
+        import numpy as np
 
-            # Calculate current angle with multiple rotations
-            current_angle = (
-                self.FULL_ROTATIONS * 360 * eased_progress + final_angle * progress
-            )
+        progress = np.linspace(0, 1, self.ANIMATION_FRAMES)
 
-            angles.append(current_angle % 360)
+        # Quadratic ease-out for realistic deceleration
+        eased_progress = 1 - (1 - progress) ** 2
 
-        return angles
+        # Calculate each angle with multiple rotations
+        angles = self.FULL_ROTATIONS * 360 * eased_progress + final_angle * progress
+        return angles % 360
 
-    def create_wheel_gif(self, selected_genre: str) -> io.BytesIO:
+    def create_wheel_gif(self, selected_genre: str) -> IO[bytes]:
         """
         Create a spinning wheel GIF that lands on the selected genre.
 
@@ -319,21 +599,123 @@ class WheelService:
             selected_genre: The genre the wheel should land on
 
         Returns:
-            BytesIO object containing the GIF data
+            File object containing the GIF data, positioned at the start
 
         Raises:
             ValueError: If the selected genre is not on the wheel
         """
-        final_angle = self._calculate_final_angle(selected_genre)
+        import numpy as np
+        from PIL import Image
+
+        snapshot = self._snapshot()
+        final_angle = self._calculate_final_angle(selected_genre, snapshot.genres)
         rotation_angles = self._generate_rotation_angles(final_angle)
 
-        # Generate frames
-        frames = [self.create_wheel_image(angle) for angle in rotation_angles]
+        # Render the wheel once, then only rotate it for each frame. Frames
+        # stay in palette mode so the GIF encoder has nothing to quantize.
+        with self._render_lock:
+            base = self._indexed_wheel_cache
+            if snapshot.version != self._genres_version:
+                base = None
+        if base is None:
+            base = self._render_base_wheel_indexed(snapshot)
+            with self._render_lock:
+                # Genres edited mid-render would leave a stale wheel cached
+                if snapshot.version == self._genres_version:
+                    self._indexed_wheel_cache = base
+        pointer_mask = self._pointer_mask
+
+        frames = []
+        for angle in rotation_angles:
+            # PIL rotates counter-clockwise while wheel angles grow clockwise
+            frame = np.array(
+                base.rotate(-angle, resample=Image.NEAREST, fillcolor=self.WHITE_INDEX)
+            )
+            frame[pointer_mask] = self._pointer_overlay[pointer_mask]
+            frames.append(frame)
+
+        return self._encode_gif(frames)
+
+    async def create_wheel_gif_async(self, selected_genre: str) -> IO[bytes]:
+        """
+        Create the spinning wheel GIF without blocking the event loop.
+
+        Rendering and encoding run in the default executor; see
+        ``create_wheel_gif`` for details.
+
+        Args:
+            selected_genre: The genre the wheel should land on
+
+        Returns:
+            File object containing the GIF data, positioned at the start
+
+        Raises:
+            ValueError: If the selected genre is not on the wheel
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.create_wheel_gif, selected_genre)
+
+    def _diff_frame(
+        self, previous: np.ndarray, current: np.ndarray, previous_pixels: np.ndarray
+    ) -> np.ndarray:
+        """
+        Build the delta frame for ``current`` cropped to what changed.
+
+        Only the bounding box of changed pixels is updated; everything outside
+        it repeats the previously encoded frame, so Pillow crops the written
+        frame to exactly that rectangle.
+        """
+        import numpy as np
+
+        changed = current != previous
+        rows = np.flatnonzero(np.any(changed, axis=1))
+        if not rows.size:
+            return previous_pixels
+
+        cols = np.flatnonzero(np.any(changed, axis=0))
+        window = (slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1))
+
+        patch = current[window].copy()
+        patch[~changed[window]] = self.GIF_TRANSPARENT_INDEX
 
-        # Create GIF in memory
-        gif_buffer = io.BytesIO()
-        imageio.mimsave(
-            gif_buffer, frames, format="GIF", duration=self.GIF_DURATION, loop=0
+        pixels = previous_pixels.copy()
+        pixels[window] = patch
+        return pixels
+
+    def _encode_gif(self, frames: list[np.ndarray]) -> IO[bytes]:
+        """
+        Encode palette index frames as a GIF with transparent diff frames.
+
+        Pixels that did not change since the previous frame are written with
+        the transparent index, so each frame only carries what moved.
+        """
+        from PIL import Image
+
+        gif_frames = []
+        previous = None
+        pixels = None
+        for current in frames:
+            if previous is None:
+                pixels = current.copy()
+            else:
+                pixels = self._diff_frame(previous, current, pixels)
+            previous = current
+
+            gif_frame = Image.fromarray(pixels, mode="P")
+            gif_frame.putpalette(self.GIF_PALETTE)
+            gif_frames.append(gif_frame)
+
+        # Create the GIF in memory, spilling large animations over to disk
+        gif_buffer = tempfile.SpooledTemporaryFile(max_size=self.GIF_SPOOL_MAX_SIZE)
+        gif_frames[0].save(
+            gif_buffer,
+            "GIF",
+            save_all=True,
+            append_images=gif_frames[1:],
+            transparency=self.GIF_TRANSPARENT_INDEX,
+            disposal=1,
+            duration=int(self.GIF_DURATION * 1000),
+            loop=0,
         )
 
         gif_buffer.seek(0)
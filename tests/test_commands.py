@@ -161,6 +161,67 @@ class TestMovieCommands(TestBotCommands):
             "The Matrix", None
         )
 
+    @pytest.mark.asyncio
+    async def test_movie_status_reuses_recent_pick(
+        self, mock_bot, mock_ctx, mock_movie_pick
+    ):
+        """Test status commands share the current pick until a skip or pick"""
+        try:
+            from bot.commands.movies import MovieCommands
+        except ImportError:
+            pytest.skip("MovieCommands not available")
+
+        rotation = mock_bot.services["rotation"]
+        rotation.skips_version = 0
+        rotation.picks_version = 0
+        rotation.rotation_version = 0
+        rotation.get_current_movie_pick = AsyncMock(return_value=mock_movie_pick)
+
+        movie_commands = MovieCommands(mock_bot)
+        await MovieCommands.movie_status.callback(movie_commands, mock_ctx)
+        await MovieCommands.movie_status.callback(movie_commands, mock_ctx)
+        assert rotation.get_current_movie_pick.await_count == 1
+        assert "The Matrix" in mock_ctx.send.call_args[0][0]
+
+        rotation.skips_version += 1
+        await MovieCommands.movie_status.callback(movie_commands, mock_ctx)
+        assert rotation.get_current_movie_pick.await_count == 2
+
+        rotation.picks_version += 1
+        await MovieCommands.movie_status.callback(movie_commands, mock_ctx)
+        assert rotation.get_current_movie_pick.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_movie_status_after_swap_shows_new_picker(self, mock_bot, mock_ctx):
+        """Test a swap drops the remembered picker straight away"""
+        try:
+            from bot.commands.movies import MovieCommands
+            from bot.commands.admin import AdminCommands
+        except ImportError:
+            pytest.skip("MovieCommands not available")
+
+        al = Mock(id=1, real_name="Al", rotation_position=0)
+        bo = Mock(id=2, real_name="Bo", rotation_position=1)
+
+        rotation = mock_bot.services["rotation"]
+        rotation.skips_version = 0
+        rotation.picks_version = 0
+        rotation.rotation_version = 0
+        rotation.get_current_movie_pick = AsyncMock(return_value=None)
+        rotation.get_current_picker = AsyncMock(return_value=(al, None, None))
+
+        movie_commands = MovieCommands(mock_bot)
+        await MovieCommands.movie_status.callback(movie_commands, mock_ctx)
+        assert "waiting for Al" in mock_ctx.send.call_args[0][0]
+
+        admin_commands = AdminCommands(mock_bot)
+        admin_commands._swap_positions = Mock(return_value=(al, bo))
+        await AdminCommands.swap_users.callback(admin_commands, mock_ctx, "al", "bo")
+        rotation.get_current_picker.return_value = (bo, None, None)
+
+        await MovieCommands.movie_status.callback(movie_commands, mock_ctx)
+        assert "waiting for Bo" in mock_ctx.send.call_args[0][0]
+
 
 class TestRatingCommands(TestBotCommands):
     """Test rating-related commands"""
@@ -259,6 +320,10 @@ class TestParsers:
         users = parse_user_list("")
         assert users == []
 
+        # Extra whitespace, blank entries and colons in real names
+        users = parse_user_list(" user1 : John Smith ,, user2:Dr: Who ")
+        assert users == [("user1", "John Smith"), ("user2", "Dr: Who")]
+
     def test_parse_rating_input(self):
         """Test parsing rating input"""
         from utils.parsers import parse_rating_input
@@ -375,6 +440,148 @@ class TestCommandParsing:
             result = parse_movie_input(input_str)
             assert result == expected, f"Failed for input: {input_str}"
 
+    def test_confirmation_check(self):
+        """Test confirmation checks only accept the phrase from the command author"""
+        from bot.commands.admin import _confirmation_check
+
+        ctx = Mock()
+        ctx.author.id = 1
+        check = _confirmation_check(ctx, "CONFIRM SKIP")
+
+        def message(content, author_id=1, channel=ctx.channel):
+            m = Mock(content=content, channel=channel)
+            m.author.id = author_id
+            return m
+
+        assert check(message("CONFIRM SKIP"))
+        assert not check(message("CONFIRM SKIP!"))
+        assert not check(message("confirm skip"))
+        assert not check(message("CONFIRM SKIP", author_id=2))
+        assert not check(message("CONFIRM SKIP", channel=Mock()))
+
+    def test_mentioned_user_id(self):
+        """Test user ids are only taken from well-formed mentions"""
+        from bot.commands.admin import _mentioned_user_id
+
+        assert _mentioned_user_id("<@123>") == 123
+        assert _mentioned_user_id("<@!123>") == 123
+        assert _mentioned_user_id("derek") is None
+        assert _mentioned_user_id("<@derek>") is None
+        assert _mentioned_user_id("<@123> extra") is None
+
+    def test_clip_reason(self):
+        """Test skip reasons are cut to the skip_reason column length"""
+        from bot.commands.admin import _clip_reason
+
+        assert _clip_reason(None) is None
+        assert _clip_reason("Paul is sick") == "Paul is sick"
+        assert _clip_reason("x" * 200) == "x" * 200
+
+        clipped = _clip_reason("x" * 5000)
+        assert len(clipped) == 200
+        assert clipped.endswith("…")
+
+    def test_embed_date_formats(self):
+        """Test embed dates match the strftime formats they replace"""
+        from datetime import date, datetime
+        from bot.commands.admin import _fmt_md, _fmt_mdy, _format_period
+
+        assert _fmt_md(date(2025, 5, 5)) == "May 05"
+        assert _fmt_mdy(datetime(2025, 12, 31, 23, 59)) == "Dec 31, 2025"
+        assert _format_period(date(2025, 1, 27), date(2025, 2, 9)) == "Jan 27 - Feb 09"
+
+    @pytest.mark.asyncio
+    async def test_list_skips_cache(self):
+        """Test !list_skips reloads only after the skips version changes"""
+        from bot.commands.admin import AdminCommands
+
+        bot = Mock()
+        bot.services = {"movie": Mock(), "rotation": Mock(), "rating": Mock()}
+        bot.services["rotation"].skips_version = 0
+        cog = AdminCommands(bot)
+        cog._load_recent_skips = Mock(return_value=(1, [("Paul", "Period", False)]))
+
+        ctx = Mock()
+        ctx.send = AsyncMock()
+
+        await AdminCommands.list_skips.callback(cog, ctx)
+        await AdminCommands.list_skips.callback(cog, ctx)
+        assert cog._load_recent_skips.call_count == 1
+        assert ctx.send.call_args.kwargs["embed"].fields[0].name == "Paul"
+
+        bot.services["rotation"].skips_version += 1
+        await AdminCommands.list_skips.callback(cog, ctx)
+        assert cog._load_recent_skips.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_field_pages(self):
+        """Test fields past Discord's limit are paged 25 at a time"""
+        from bot.commands.admin import _FieldPages
+
+        fields = [(f"User {i}", f"@user{i}", True) for i in range(60)]
+        view = _FieldPages(1, "Members", "Total: 60", 0x0099FF, fields)
+
+        assert [len(page) for page in view.pages] == [25, 25, 10]
+        assert view.previous_page.disabled
+        assert not view.next_page.disabled
+
+        embed = view.page_embed()
+        assert embed.title == "Members"
+        assert len(embed.fields) == 25
+        assert embed.footer.text == "Page 1/3"
+
+        interaction = Mock()
+        interaction.response.edit_message = AsyncMock()
+        await view.next_page.callback(interaction)
+        await view.next_page.callback(interaction)
+
+        embed = interaction.response.edit_message.call_args.kwargs["embed"]
+        assert embed.fields[-1].name == "User 59"
+        assert embed.footer.text == "Page 3/3"
+        assert view.next_page.disabled
+
+    @pytest.mark.asyncio
+    async def test_resolve_username(self):
+        """Test mentions resolve from the user cache before fetching once"""
+        from bot.commands.admin import AdminCommands
+
+        bot = Mock()
+        bot.services = {"movie": Mock(), "rotation": Mock(), "rating": Mock()}
+        cached, fetched = Mock(), Mock()
+        cached.name, fetched.name = "cached_user", "fetched_user"
+        bot.get_user = Mock(side_effect=lambda uid: cached if uid == 1 else None)
+        bot.fetch_user = AsyncMock(return_value=fetched)
+        cog = AdminCommands(bot)
+
+        assert await cog._resolve_username(" @derek ") == "derek"
+        assert await cog._resolve_username("<@1>") == "cached_user"
+        assert await cog._resolve_username("<@!2>") == "fetched_user"
+        assert await cog._resolve_username("<@2>") == "fetched_user"
+        bot.fetch_user.assert_awaited_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_await_confirmation_timeout(self):
+        """Test a timed out confirmation replaces the prompt and returns False"""
+        from bot.commands.admin import AdminCommands
+
+        bot = Mock()
+        bot.services = {"movie": Mock(), "rotation": Mock(), "rating": Mock()}
+        bot.wait_for = AsyncMock(side_effect=asyncio.TimeoutError)
+        cog = AdminCommands(bot)
+
+        ctx = Mock()
+        prompt_msg = Mock()
+        prompt_msg.edit = AsyncMock()
+        ctx.send = AsyncMock(return_value=prompt_msg)
+
+        confirmed = await cog._await_confirmation(ctx, "Type YES", "YES", "Cancelled")
+        assert not confirmed
+        ctx.send.assert_awaited_once_with("Type YES")
+        prompt_msg.edit.assert_awaited_once_with(content="Cancelled", embed=None)
+
+        bot.wait_for = AsyncMock()
+        assert await cog._await_confirmation(ctx, discord.Embed(), "YES", "Cancelled")
+
 
 # Mock command classes for testing if imports fail
 class MockRotationCommands:
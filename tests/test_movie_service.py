@@ -256,6 +256,38 @@ class TestMovieService:
         assert movie_info["directors"] == []
         assert movie_info["cast"] == []
 
+    @pytest.mark.asyncio
+    async def test_search_movie_cache(self, movie_service):
+        """Test successful searches are cached and concurrent ones shared"""
+        found = (True, "Success", {"title": "The Matrix", "year": 1999})
+        fetch = AsyncMock(return_value=found)
+
+        with patch.object(movie_service, "_fetch_movie", fetch):
+            results = await asyncio.gather(
+                movie_service.search_movie("The Matrix", 1999),
+                movie_service.search_movie("the matrix ", 1999),
+            )
+            assert results == [found, found]
+            assert fetch.await_count == 1
+
+            assert await movie_service.search_movie("THE MATRIX", 1999) == found
+            assert fetch.await_count == 1
+
+            # A different year is a different search
+            await movie_service.search_movie("The Matrix", 2003)
+            assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_movie_failures_not_cached(self, movie_service):
+        """Test failed searches are retried on the next call"""
+        fetch = AsyncMock(return_value=(False, "❌ No movies found", None))
+
+        with patch.object(movie_service, "_fetch_movie", fetch):
+            await movie_service.search_movie("Nonexistent")
+            await movie_service.search_movie("Nonexistent")
+
+        assert fetch.await_count == 2
+
 
 # Run tests
 if __name__ == "__main__":
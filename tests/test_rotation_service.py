@@ -131,7 +131,7 @@ class TestRotationService:
         await rotation_service.update_rotation_start_date(start_date)
 
         pick_date = datetime(2025, 5, 12)
-        movie_pick = await rotation_service.add_historical_pick(
+        movie_pick, picker = await rotation_service.add_historical_pick(
             username="paul",
             movie_title="Event Horizon",
             movie_year=1997,
@@ -140,7 +140,7 @@ class TestRotationService:
 
         assert movie_pick.movie_title == "Event Horizon"
         assert movie_pick.pick_date == pick_date
-        assert movie_pick.picker.discord_username == "paul"
+        assert picker.discord_username == "paul"
 
     @pytest.mark.asyncio
     async def test_get_recent_picks(self, rotation_service, sample_users):
@@ -0,0 +1,173 @@
+"""
+Tests for wheel service functionality
+"""
+
+import math
+import pytest
+from unittest.mock import Mock
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from services.wheel_service import WheelService
+
+
+class TestWheelService:
+    """Test cases for WheelService"""
+
+    @pytest.fixture
+    def wheel_service(self):
+        """Create WheelService instance for testing"""
+        return WheelService(Mock())
+
+    def test_segment_colors(self, wheel_service):
+        """Test segments are painted with the wheel colors in order"""
+        image = wheel_service.create_wheel_image(0)
+        center, radius = wheel_service._get_center_and_radius()
+        angle_per_segment = 360 / wheel_service.genre_count
+
+        # Sample a pixel near the rim in the middle of the first two segments
+        for i in range(2):
+            angle = math.radians(i * angle_per_segment + angle_per_segment / 2)
+            x = center[0] + int(radius * 0.9 * math.cos(angle))
+            y = center[1] + int(radius * 0.9 * math.sin(angle))
+            assert image.getpixel((x, y)) == wheel_service.WHEEL_COLORS[i]
+
+    def test_background_outside_wheel(self, wheel_service):
+        """Test the area outside the wheel stays white"""
+        image = wheel_service.create_wheel_image(0)
+        assert image.getpixel((0, wheel_service.IMAGE_SIZE - 1)) == (255, 255, 255)
+
+    def test_gif_animation_frames(self, wheel_service):
+        """Test the spin GIF decodes with every animation frame"""
+        gif = Image.open(wheel_service.create_wheel_gif(wheel_service.genres[0]))
+        assert gif.format == "GIF"
+        assert gif.n_frames == wheel_service.ANIMATION_FRAMES
+
+    def test_gif_frames_cropped_to_wheel(self, wheel_service):
+        """Test delta frames only cover the area of the spinning wheel"""
+        gif = Image.open(wheel_service.create_wheel_gif(wheel_service.genres[0]))
+        assert gif.size == (wheel_service.ANIMATION_SIZE,) * 2
+
+        # Wheel bounds scaled down to the animation size
+        scale = wheel_service.ANIMATION_SIZE / wheel_service.IMAGE_SIZE
+        (cx, cy), radius = wheel_service._get_center_and_radius()
+        cx, cy, radius = cx * scale, cy * scale, radius * scale
+
+        for frame_number in range(1, gif.n_frames):
+            gif.seek(frame_number)
+            left, top, right, bottom = gif.tile[0][1]
+            assert cx - radius - 2 <= left and right <= cx + radius + 2
+            assert cy - radius - 2 <= top and bottom <= cy + radius + 2
+
+    @pytest.mark.asyncio
+    async def test_gif_async_matches_sync(self, wheel_service):
+        """Test the async GIF helper produces the same animation"""
+        genre = wheel_service.genres[0]
+        gif_data = await wheel_service.create_wheel_gif_async(genre)
+        assert gif_data.read() == wheel_service.create_wheel_gif(genre).read()
+
+    @pytest.mark.asyncio
+    async def test_gif_async_unknown_genre(self, wheel_service):
+        """Test the async GIF helper rejects genres not on the wheel"""
+        with pytest.raises(ValueError):
+            await wheel_service.create_wheel_gif_async("Not A Genre")
+
+    @pytest.mark.asyncio
+    async def test_png_async_matches_sync(self, wheel_service):
+        """Test the async PNG helper renders the same image"""
+        png = await wheel_service.create_wheel_png_async(45)
+        assert png == wheel_service.create_wheel_png(45)
+
+    def test_static_png_cached_until_genres_change(self, wheel_service):
+        """Test the static wheel PNG is reused and refreshed on genre changes"""
+        png = wheel_service.get_static_wheel_png()
+        assert png.startswith(b"\x89PNG")
+        assert wheel_service.get_static_wheel_png() is png
+
+        assert wheel_service.add_genre("Heist")
+        assert wheel_service.get_static_wheel_png() is not png
+
+        png = wheel_service.get_static_wheel_png()
+        assert wheel_service.remove_genre("Heist")
+        assert wheel_service.get_static_wheel_png() is not png
+
+    def test_gif_skips_caching_wheel_edited_mid_render(self, wheel_service):
+        """Test a base wheel rendered before a genre change is not cached"""
+        render = wheel_service._render_base_wheel_indexed
+
+        def render_then_edit(snapshot):
+            base = render(snapshot)
+            wheel_service.add_genre("Heist")
+            return base
+
+        wheel_service._render_base_wheel_indexed = render_then_edit
+        wheel_service.create_wheel_gif("Horror").close()
+        assert wheel_service._indexed_wheel_cache is None
+
+        wheel_service._render_base_wheel_indexed = render
+        wheel_service.create_wheel_gif("Heist").close()
+        assert wheel_service._indexed_wheel_cache is not None
+
+    def test_render_snapshot_unaffected_by_genre_edits(self, wheel_service):
+        """Test a render's snapshot keeps its labels and angles in step"""
+        snapshot = wheel_service._snapshot()
+        for i in range(200):
+            wheel_service.add_genre(f"Genre {i}")
+
+        assert len(snapshot.labels) == len(snapshot.genres)
+        assert len(snapshot.text_cos) == len(snapshot.genres)
+        assert snapshot.labels == wheel_service.DEFAULT_GENRES
+        wheel_service._render_base_wheel(snapshot)
+
+    def test_add_and_remove_genre(self, wheel_service):
+        """Test adding and removing genres rejects duplicates and unknowns"""
+        assert wheel_service.add_genre(" Heist ")
+        assert not wheel_service.add_genre("Heist")
+        assert wheel_service.genre_list[-1] == "Heist"
+
+        assert wheel_service.remove_genre("Heist")
+        assert not wheel_service.remove_genre("Heist")
+        assert "Heist" not in wheel_service.genre_list
+
+    def test_rotation_angles_end_on_final_angle(self, wheel_service):
+        """Test the spin animation starts at rest and stops on the genre"""
+        final_angle = wheel_service._calculate_final_angle("Horror")
+        angles = wheel_service._generate_rotation_angles(final_angle)
+
+        assert len(angles) == wheel_service.ANIMATION_FRAMES
+        assert angles[0] == 0
+        assert angles[-1] == pytest.approx(final_angle % 360)
+
+    def test_narrow_segments_use_numeric_labels(self, wheel_service):
+        """Test labels fall back to numbers once segments get too narrow"""
+        wheel_service._ensure_render_resources()
+        assert wheel_service._labels == wheel_service.genre_list
+
+        for i in range(200):
+            wheel_service.add_genre(f"Genre {i}")
+
+        assert wheel_service._labels[0] == "1"
+        assert wheel_service._labels[-1] == str(wheel_service.genre_count)
+
+    def test_spin_wheel_picks_every_genre(self, wheel_service):
+        """Test spinning only returns genres on the wheel and can reach each"""
+        spins = {wheel_service.spin_wheel() for _ in range(2000)}
+        assert spins == set(wheel_service.genre_list)
+
+    def test_spin_wheel_single_genre(self, wheel_service):
+        """Test spinning a wheel with one genre always returns it"""
+        for genre in wheel_service.genre_list[1:]:
+            wheel_service.remove_genre(genre)
+        assert wheel_service.spin_wheel() == wheel_service.genre_list[0]
+
+    def test_spin_empty_wheel(self, wheel_service):
+        """Test spinning an empty wheel raises an error"""
+        for genre in wheel_service.genre_list:
+            wheel_service.remove_genre(genre)
+        with pytest.raises(ValueError):
+            wheel_service.spin_wheel()
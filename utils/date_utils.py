@@ -3,14 +3,33 @@ Date parsing and formatting utilities
 """
 
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Optional, Union
 import re
 
-
+# Date formats parse_date tries, in order
+_DATE_FORMATS = (
+    "%B %d, %Y",  # May 10, 2025
+    "%b %d, %Y",  # May 10, 2025
+    "%Y-%m-%d",  # 2025-05-10
+    "%m/%d/%Y",  # 05/10/2025
+    "%d/%m/%Y",  # 10/05/2025
+    "%Y/%m/%d",  # 2025/05/10
+    "%B %d %Y",  # May 10 2025
+    "%b %d %Y",  # May 10 2025
+    "%m-%d-%Y",  # 05-10-2025
+    "%d-%m-%Y",  # 10-05-2025
+)
+
+
+@lru_cache(maxsize=256)
 def parse_date(date_str: str) -> Optional[datetime]:
     """
     Parse date string in various formats
 
+    Results are cached; the returned datetime is immutable so it is safe to
+    share between callers.
+
     Args:
         date_str: Date string to parse
 
@@ -22,21 +41,7 @@ def parse_date(date_str: str) -> Optional[datetime]:
 
     date_str = date_str.strip()
 
-    # Common date formats to try
-    formats = [
-        "%B %d, %Y",  # May 10, 2025
-        "%b %d, %Y",  # May 10, 2025
-        "%Y-%m-%d",  # 2025-05-10
-        "%m/%d/%Y",  # 05/10/2025
-        "%d/%m/%Y",  # 10/05/2025
-        "%Y/%m/%d",  # 2025/05/10
-        "%B %d %Y",  # May 10 2025
-        "%b %d %Y",  # May 10 2025
-        "%m-%d-%Y",  # 05-10-2025
-        "%d-%m-%Y",  # 10-05-2025
-    ]
-
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
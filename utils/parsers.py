@@ -5,6 +5,9 @@ Input parsing utilities for bot commands
 import re
 from typing import Optional, Tuple, List, Dict, Any
 
+# One "username" or "username:real name" entry of a comma-separated user list
+_USER_PAIR_RE = re.compile(r"\s*([^:,]*?)\s*(?::\s*([^,]*?)\s*)?(?:,|$)")
+
 
 def parse_movie_input(movie_input: str) -> Tuple[str, Optional[int]]:
     """
@@ -57,21 +60,14 @@ def parse_user_list(user_list_str: str) -> List[Tuple[str, str]]:
     if not user_list_str:
         return []
 
-    user_data = []
-
-    for pair in user_list_str.split(","):
-        pair = pair.strip()
-        if not pair:
-            continue
-
-        if ":" in pair:
-            username, real_name = pair.split(":", 1)
-            user_data.append((username.strip(), real_name.strip()))
-        else:
-            username = pair
-            user_data.append((username.strip(), username.strip()))
-
-    return user_data
+    # Single pass over the string; blank entries match as empty and are skipped
+    return [
+        (username, username if real_name is None else real_name)
+        for username, real_name in (
+            match.groups() for match in _USER_PAIR_RE.finditer(user_list_str)
+        )
+        if username or real_name is not None
+    ]
 
 
 def parse_rating_input(rating_str: str) -> Tuple[Optional[float], Optional[str]]: